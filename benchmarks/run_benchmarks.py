@@ -0,0 +1,355 @@
+"""
+Benchmarks reproducibles de los caminos críticos del motor y la animación
+
+Se ejecutan sin ventana (backend Agg) y guardan los resultados en JSON junto
+con metadatos del entorno. Si se indica una línea base, cada benchmark se
+compara con ella y el proceso termina con código 1 ante una regresión.
+
+Cada repetición ejecuta la función tantas veces como haga falta para durar
+al menos MIN_REPEAT_TIME. Las repeticiones de todos los benchmarks se
+intercalan por rondas, todo se repite en varios procesos nuevos y se
+compara la mediana normalizada por un bucle de calibración medido en las
+mismas rondas: así la comparación descuenta la velocidad de la máquina
+durante la ejecución (otra VM, frecuencia de CPU, vecinos ruidosos) y no
+solo el ruido de cada llamada.
+
+    python -m benchmarks.run_benchmarks --output resultados.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import scipy
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from src.animation_manager import AnimationManager
+from src.config import ANIMATION_CONFIG, COLORS
+from src.physics_engine import PhysicsEngine
+
+FORCE_TYPES = ("Coseno", "Seno", "Pulso", "Escalón")
+
+# Regímenes de amortiguamiento con m = 1 kg, k = 4 N/m (c crítico = 4 N·s/m)
+DAMPING_REGIMES = {
+    "libre": 0.0,
+    "subamortiguado": 0.5,
+    "critico": 4.0,
+    "sobreamortiguado": 6.0,
+}
+
+BASE_PARAMETERS = {"mass": 1.0, "stiffness": 4.0, "force_amplitude": 3.0, "frequency": 2.0}
+
+# Tolerancia relativa por defecto antes de considerar una regresión: en una
+# VM de 1 CPU el mismo código varía hasta ~30 % entre ejecuciones completas
+DEFAULT_TOLERANCE = 0.5
+
+# Duración mínima de cada repetición (en segundos)
+MIN_REPEAT_TIME = 0.025
+
+# Nombre interno del bucle de calibración entre los benchmarks
+CALIBRATION = "calibration"
+
+
+def calibrate_number(timer, min_time=MIN_REPEAT_TIME):
+    """Llamadas por repetición para durar al menos 'min_time' (como Timer.autorange)
+
+    Sirve además de calentamiento (cachés, importaciones diferidas).
+    """
+    number = 1
+    while True:
+        for factor in (1, 2, 5):
+            if timer.timeit(number * factor) >= min_time:
+                return number * factor
+        number *= 10
+
+
+def measure(functions, repeat=11):
+    """Medir varias funciones y devolver estadísticas en microsegundos por llamada
+
+    Las repeticiones se intercalan por rondas (una de cada función por
+    ronda), así que una racha lenta de la máquina cae sobre todas por igual
+    en lugar de sobre el benchmark que se estuviera midiendo en ese momento.
+    """
+    timers = {name: timeit.Timer(function) for name, function in functions.items()}
+    numbers = {name: calibrate_number(timer) for name, timer in timers.items()}
+    samples = {name: [] for name in timers}
+    for _ in range(repeat):
+        for name, timer in timers.items():
+            samples[name].append(timer.timeit(numbers[name]) / numbers[name] * 1e6)
+    return {
+        name: {
+            "median_us": statistics.median(values),
+            "min_us": min(values),
+            "mean_us": statistics.fmean(values),
+            "repeat": repeat,
+            "number": numbers[name],
+        }
+        for name, values in samples.items()
+    }
+
+
+def calibration_loop():
+    """Carga fija de Python y numpy con la que se mide la velocidad de la máquina"""
+    values = np.linspace(0.0, 1.0, 800)
+    total = 0.0
+    for i in range(200):
+        total += float(np.sin(values * i).sum()) + i * 0.5
+    return total
+
+
+def headless_animation():
+    """AnimationManager sobre figuras Agg con el mismo tamaño que la aplicación"""
+    figures = []
+    for _ in range(2):
+        figure = Figure(figsize=(4.5, 3), facecolor=COLORS["secondary"])
+        FigureCanvasAgg(figure)
+        figures.append((figure, figure.add_subplot(111)))
+    (fig_anim, ax_anim), (fig_graph, ax_graph) = figures
+    return AnimationManager(fig_anim, ax_anim, fig_graph, ax_graph)
+
+
+def bench_solve_system(benchmarks, method):
+    """solve_system para cada tipo de fuerza y régimen de amortiguamiento"""
+    t_max = ANIMATION_CONFIG["simulation_time"]
+    num_points = ANIMATION_CONFIG["frames"]
+    for force_type in FORCE_TYPES:
+        for regime, damping in DAMPING_REGIMES.items():
+            # Un motor por caso: las rondas intercaladas no pueden compartir parámetros
+            engine = PhysicsEngine(method=method)
+            engine.set_parameters(damping=damping, force_type=force_type, **BASE_PARAMETERS)
+            benchmarks[f"solve_system[{method}:{force_type}:{regime}]"] = functools.partial(
+                engine.solve_system, t_max=t_max, num_points=num_points
+            )
+
+
+def bench_animation(benchmarks):
+    """Geometría del resorte, bucles de update_animation y renderizado por frame"""
+    engine = PhysicsEngine()
+    engine.set_parameters(damping=0.5, force_type="Coseno", **BASE_PARAMETERS)
+    solution_t, solution_y = engine.solve_system(
+        t_max=ANIMATION_CONFIG["simulation_time"], num_points=ANIMATION_CONFIG["frames"]
+    )
+    frames = len(solution_t)
+    manager = headless_animation()
+    geometry = manager.precompute_frames(solution_y)
+
+    def spring_coords():
+        for y in solution_y:
+            manager.create_spring_coords(y)
+
+    def update_loop(geometry=None):
+        manager.graph_source = None  # cada repetición vuelve a cargar la curva
+        for frame in range(frames):
+            manager.update_animation(frame, solution_t, solution_y, engine, geometry)
+
+    def render_loop():
+        manager.start_animation(solution_t, solution_y, engine, precompute=True)
+        for _ in range(frames):
+            manager.scheduler.tick()
+        manager.stop_animation()
+
+    benchmarks["create_spring_coords[800]"] = spring_coords
+    benchmarks["precompute_frames[800]"] = lambda: manager.precompute_frames(solution_y)
+    benchmarks["update_animation[800]"] = update_loop
+    benchmarks["update_animation_precomputed[800]"] = lambda: update_loop(geometry)
+    benchmarks["render_ticks[800]"] = render_loop
+
+
+def bench_system_info(benchmarks):
+    """get_system_info (se llama en cada cambio de parámetro)"""
+    engine = PhysicsEngine()
+    engine.set_parameters(damping=0.5, force_type="Coseno", **BASE_PARAMETERS)
+    benchmarks["get_system_info"] = engine.get_system_info
+
+
+def git_revision():
+    """Commit actual del repositorio, o None si no está disponible"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def git_dirty():
+    """Si hay cambios sin commit en el código medido (la línea base no cuenta)"""
+    try:
+        return bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no", "--",
+             ".", ":!benchmarks/baseline.json"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    """Metadatos del entorno de ejecución"""
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "matplotlib": matplotlib.__version__,
+        "backend": matplotlib.get_backend(),
+        "git_revision": git_revision(),
+        "git_dirty": git_dirty(),
+    }
+
+
+def compare(results, baseline, tolerance, calibration_us=None):
+    """Comparar con la línea base: (cocientes, regresiones, entradas desactualizadas)
+
+    Se compara la mediana de las repeticiones. Si ambas ejecuciones tienen
+    calibración, cada mediana se divide por la suya antes de comparar. Las
+    entradas más rápidas que la línea base por más de la tolerancia se
+    señalan como desactualizadas: con esa referencia, una regresión real
+    tendría que ser varias veces más lenta que el código actual para
+    detectarse.
+    """
+    scale = 1.0
+    if calibration_us and baseline.get("calibration_us"):
+        scale = baseline["calibration_us"] / calibration_us
+    comparison = {}
+    regressions = []
+    stale = []
+    for name, current in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = current["median_us"] * scale / reference["median_us"]
+        comparison[name] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+        elif ratio < 1 / (1 + tolerance):
+            stale.append(name)
+    return comparison, regressions, stale
+
+
+def run(only=None, method="auto", repeat=11):
+    """Ejecutar los grupos de benchmarks seleccionados
+
+    Devuelve (resultados, µs de la calibración medida en las mismas rondas).
+    """
+    groups = {
+        "solve": lambda benchmarks: bench_solve_system(benchmarks, method),
+        "animation": bench_animation,
+        "info": bench_system_info,
+    }
+    benchmarks = {CALIBRATION: calibration_loop}
+    for name, group in groups.items():
+        if only is None or name in only:
+            group(benchmarks)
+    results = measure(benchmarks, repeat)
+    return results, results.pop(CALIBRATION)["median_us"]
+
+
+def run_processes(only=None, method="auto", repeat=11, processes=3):
+    """Repetir run() en procesos nuevos y combinar sus medianas
+
+    Cada proceso tiene su propia disposición de memoria y su propio estado
+    del asignador, que mueven los tiempos de un mismo código bastante más que
+    el ruido entre llamadas. Por benchmark se toma la mediana entre procesos
+    del tiempo normalizado por la calibración de cada uno.
+    """
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for _ in range(processes):
+        with context.Pool(1) as pool:
+            runs.append(pool.apply(run, (only, method, repeat)))
+    calibration_us = statistics.median(calibration for _, calibration in runs)
+    results = {}
+    for name in runs[0][0]:
+        normalized = [results_p[name]["median_us"] / calibration_p
+                      for results_p, calibration_p in runs]
+        results[name] = {
+            "median_us": statistics.median(normalized) * calibration_us,
+            "min_us": min(results_p[name]["min_us"] for results_p, _ in runs),
+            "process_medians_us": [results_p[name]["median_us"] for results_p, _ in runs],
+            "repeat": repeat,
+            "number": runs[0][0][name]["number"],
+            "processes": processes,
+        }
+    return results, calibration_us
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmarks del laboratorio masa-resorte")
+    parser.add_argument("--output", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="línea base JSON con la que comparar")
+    parser.add_argument("--save-baseline", help="guardar los resultados como nueva línea base")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="aumento relativo del tiempo tolerado (0.5 = 50%%)")
+    parser.add_argument("--only", nargs="+", choices=("solve", "animation", "info"))
+    parser.add_argument("--method", default="auto", help="método de solve_system")
+    parser.add_argument("--repeat", type=int, default=11, help="rondas por proceso")
+    parser.add_argument("--strict-baseline", action="store_true",
+                        help="terminar con código 1 también si la línea base está desactualizada")
+    parser.add_argument("--processes", type=int, default=3,
+                        help="procesos nuevos en los que se repite la medición")
+    args = parser.parse_args(argv)
+
+    results, calibration_us = run_processes(args.only, args.method, args.repeat,
+                                            args.processes)
+    report = {"environment": environment(), "calibration_us": calibration_us, "results": results}
+
+    width = max(len(name) for name in results)
+    print(f"{'calibración':<{width}}  {calibration_us:>12.1f} µs")
+    for name, stats in results.items():
+        print(f"{name:<{width}}  {stats['median_us']:>12.1f} µs")
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparison, regressions, stale = compare(results, baseline, args.tolerance, calibration_us)
+        report["baseline"] = {
+            "path": args.baseline,
+            "environment": baseline.get("environment"),
+            "tolerance": args.tolerance,
+            "ratios": comparison,
+            "regressions": regressions,
+            "stale": stale,
+        }
+        if baseline.get("environment", {}).get("platform") != report["environment"]["platform"]:
+            print("Aviso: la línea base se midió en otra plataforma", file=sys.stderr)
+        for name in regressions:
+            print(f"REGRESIÓN {name}: {comparison[name]:.2f}x la línea base", file=sys.stderr)
+        for name in stale:
+            print(f"Aviso: línea base desactualizada para {name}: {comparison[name]:.2f}x "
+                  f"(regénérala con --save-baseline)")
+        status = 1 if regressions or (stale and args.strict_baseline) else 0
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
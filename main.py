@@ -1,20 +1,38 @@
 #!/usr/bin/env python3
 """
 Punto de entrada principal del Laboratorio Virtual Masa-Resorte
+
+Uso: python main.py [--startup-times]
+  --startup-times  medir el arranque e informar el tiempo de importación por módulo
 """
 
-import tkinter as tk
-from src.welcome_screen import WelcomeScreen
+import sys
 
 def main():
     """Función principal de la aplicación"""
+    # El medidor se instala antes de importar tkinter y la interfaz
+    timer = None
+    if "--startup-times" in sys.argv[1:]:
+        from src import startup_profile
+        timer = startup_profile.start()
+
     try:
+        import tkinter as tk
+        from src.welcome_screen import WelcomeScreen
+
         root = tk.Tk()
         app = WelcomeScreen(root)
+        if timer is not None:
+            root.update()
+            timer.mark("bienvenida visible")
+            timer.report()
         root.mainloop()
+        if timer is not None:
+            timer.mark("salida")
+            timer.report()
     except Exception as e:
         print(f"Error al iniciar la aplicación: {e}")
         input("Presiona Enter para salir...")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,13 +3,98 @@ Gestor de animaciones y visualizaciones
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.patches import Circle
+from matplotlib.transforms import Bbox, TransformedBbox, blended_transform_factory
+
+from .blit_renderer import BlitManager
+from .perf_monitor import timed
+from .render_scheduler import RenderScheduler, PlaybackClock
+from .spring_geometry import (
+    SPRING_POINTS, MIN_COILS, MAX_COILS, CHAIN_PROFILE_BASE, CHAIN_PROFILE_HEIGHT,
+    WALL_X, EQUILIBRIUM_X, spring_templates, spring_frames, chain_points_per_spring,
+    chain_frames,
+)
+
+
+def graph_limits(solution_t, solution_y):
+    """Límites del gráfico (x_max, y_max) para cada frame a partir de envolventes acumuladas
+
+    El límite en y sigue la envolvente max|y| hasta el frame, cuantizada hacia
+    arriba en pasos geométricos (x1.25), y el de x crece por duplicación: los
+    ejes solo cambian cuando la envolvente cruza un umbral.
+    """
+    envelope = np.maximum(1, np.maximum.accumulate(np.abs(solution_y)))
+    y_limits = 1.2 * 1.25 ** np.ceil(np.log(envelope) / np.log(1.25) - 1e-9)
+    x_limits = 20 * 2.0 ** np.ceil(np.log2(np.maximum(np.asarray(solution_t) + 1, 20) / 20))
+    return x_limits, y_limits
+
+
+class RingBuffer:
+    """Búfer circular de (t, y) con vista ordenada sin copias
+
+    Cada muestra se escribe dos veces (en i y en i + capacidad), de modo que
+    las últimas 'capacidad' muestras siempre forman un bloque contiguo.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.t = np.zeros(2 * capacity)
+        self.y = np.zeros(2 * capacity)
+        self.count = 0
+
+    def append(self, t, y):
+        """Agregar una muestra en O(1)"""
+        index = self.count % self.capacity
+        self.t[index] = self.t[index + self.capacity] = t
+        self.y[index] = self.y[index + self.capacity] = y
+        self.count += 1
+
+    def view(self):
+        """Vistas (t, y) de las muestras guardadas en orden cronológico"""
+        size = min(self.count, self.capacity)
+        end = self.count % self.capacity + self.capacity if self.count >= self.capacity else self.count
+        return self.t[end - size:end], self.y[end - size:end]
+
+
+def loop_frame(solution_t, elapsed):
+    """Índice de la muestra vigente tras 'elapsed' segundos de una trayectoria en bucle"""
+    n = len(solution_t)
+    t0 = solution_t[0]
+    period = solution_t[-1] - t0 + (solution_t[1] - t0 if n > 1 else 1.0)
+    sim_time = t0 + elapsed % period
+    return min(int(np.searchsorted(solution_t, sim_time, side="right")) - 1, n - 1)
+
+
+def realtime_batches(samples, clock):
+    """Lotes (índice, muestras) de un flujo (t, y) según el reloj de pared
+
+    Cada lote contiene todas las muestras cuyo tiempo ya pasó; None si en
+    este tick no venció ninguna.
+    """
+    pending = next(samples, None)
+    if pending is None:
+        return
+    t0 = pending[0]
+    clock.restart()
+    index = 0
+    while pending is not None:
+        now = t0 + clock.elapsed()
+        batch = []
+        while pending is not None and pending[0] <= now:
+            batch.append(pending)
+            pending = next(samples, None)
+        if not batch:
+            yield None
+            continue
+        clock.record(len(batch))
+        index += len(batch)
+        yield index - 1, batch
+
 
 class AnimationManager:
     """Gestiona las animaciones y gráficas del sistema"""
     
-    def __init__(self, fig_anim, ax_anim, fig_graph, ax_graph):
+    def __init__(self, fig_anim, ax_anim, fig_graph, ax_graph, max_interval=100):
         self.fig_anim = fig_anim
         self.ax_anim = ax_anim
         self.fig_graph = fig_graph
@@ -22,7 +107,28 @@ class AnimationManager:
         self.time_line = None
         self.res_text = None
         
-        self.ani = None
+        # Fuente de frames actual y reloj de reproducción a velocidad real
+        self.frames = None
+        self.frame_callback = None
+        self.playback_clock = None
+        self.paused = False
+        
+        # Trayectoria en reproducción: (t, y, geometría) se reemplaza de una sola vez
+        self.trajectory = None
+        self.trajectory_engine = None
+        self.trajectory_frame = None
+        self.trajectory_update = self.update_animation
+        
+        # Blitting con fondo cacheado en ambos canvas, bajo un único reloj
+        self.blit_anim = BlitManager(fig_anim.canvas)
+        self.blit_graph = BlitManager(fig_graph.canvas)
+        self.scheduler = RenderScheduler(fig_anim.canvas, max_interval=max_interval)
+        self.scheduler.add_canvas("anim", self.blit_anim)
+        self.scheduler.add_canvas("graph", self.blit_graph)
+        
+        # Plantillas del resorte y búfer reutilizado para x (sin asignaciones por frame)
+        self.spring_ramp, self.spring_profiles = spring_templates()
+        self.spring_x = np.empty(SPRING_POINTS)
         self.setup_animation_elements()
     
     def setup_animation_elements(self):
@@ -38,19 +144,27 @@ class AnimationManager:
         self.ax_anim.grid(True, alpha=0.3, color="#00D4FF")
         
         # Pared
-        self.wall_x = -6
+        self.wall_x = WALL_X
         self.ax_anim.axvline(x=self.wall_x, color="#FF2E63", linewidth=8, alpha=0.8)
         
         # Resorte y masa
         self.spring_line, = self.ax_anim.plot([], [], "#00D4FF", linewidth=4, alpha=0.9)
-        self.equilibrium_x = 0
-        self.mass = plt.Circle((self.equilibrium_x, 0), 0.2, fc="#FF2E63", 
-                              ec="#FF2E63", linewidth=2)
+        self.equilibrium_x = EQUILIBRIUM_X
+        self.mass = Circle((self.equilibrium_x, 0), 0.2, fc="#FF2E63", 
+                           ec="#FF2E63", linewidth=2)
         self.ax_anim.add_patch(self.mass)
         
         # Línea de equilibrio
-        self.ax_anim.axvline(x=self.equilibrium_x, color="#64FFDA", 
-                            linestyle="--", alpha=0.5, linewidth=1)
+        self.equilibrium_line = self.ax_anim.axvline(x=self.equilibrium_x, color="#64FFDA", 
+                                                     linestyle="--", alpha=0.5, linewidth=1)
+        
+        # Cadena de masas (oculta en el modo de una sola masa): resortes con las
+        # masas como marcadores y perfil de desplazamientos debajo
+        self.chain_line, = self.ax_anim.plot([], [], "#00D4FF", linewidth=1.5, marker="o",
+                                             markerfacecolor="#FF2E63", markeredgecolor="#FF2E63",
+                                             visible=False)
+        self.chain_profile, = self.ax_anim.plot([], [], "#FFD166", linewidth=1.5, visible=False)
+        self.chain_split = None
         
         # Texto de resonancia
         self.res_text = self.ax_anim.text(0, 1.3, "", fontsize=10, ha="center", 
@@ -61,6 +175,8 @@ class AnimationManager:
         for spine in self.ax_anim.spines.values():
             spine.set_color("#00D4FF")
         
+        self.blit_anim.set_artists([self.spring_line, self.mass, self.res_text])
+        
         # Configurar gráfico de desplazamiento
         self.setup_graph_plot()
     
@@ -77,14 +193,29 @@ class AnimationManager:
         self.ax_graph.tick_params(colors="white", labelsize=8)
 
         self.graph_line, = self.ax_graph.plot([], [], "#64FFDA", linewidth=2)
+        # La curva completa se carga una vez; cada frame solo mueve el borde
+        # derecho de su recorte (x en datos, y en coordenadas de ejes)
+        self.graph_reveal = Bbox([[0, 0], [0, 1]])
+        self.graph_line.set_clip_box(TransformedBbox(
+            self.graph_reveal,
+            blended_transform_factory(self.ax_graph.transData, self.ax_graph.transAxes)
+        ))
+        self.graph_source = None
+        self.graph_limits = (0, 20, 3)
         self.time_line = self.ax_graph.axvline(x=0, color="#FF2E63", 
                                               linestyle="--", alpha=0.7)
 
         for spine in self.ax_graph.spines.values():
             spine.set_color("#64FFDA")
+        
+        self.blit_graph.set_artists([self.graph_line, self.time_line])
     
     def create_spring_coords(self, y_pos):
-        """Crear coordenadas del resorte con ondulación realista"""
+        """Crear coordenadas del resorte con ondulación realista
+
+        Devuelve vistas de búferes compartidos: se sobrescriben en la siguiente
+        llamada, así que deben copiarse si se quieren conservar.
+        """
         wall_x = self.wall_x
         natural_length = abs(self.equilibrium_x - wall_x)
         mass_x = self.equilibrium_x + y_pos
@@ -99,53 +230,86 @@ class AnimationManager:
         elif mass_x > max_stretch:
             mass_x = max_stretch - (y_pos - (max_stretch - self.equilibrium_x)) * 0.1
         
-        # Crear resorte
+        # Crear resorte: escalar la rampa unitaria en el búfer preasignado
         spring_length = mass_x - wall_x
-        num_points = 150
-        x_vals = np.linspace(wall_x, mass_x, num_points)
+        x_vals = np.multiply(self.spring_ramp, spring_length, out=self.spring_x)
+        x_vals += wall_x
         
-        # Ondulación del resorte
+        # Ondulación del resorte (perfil precalculado según el número de espiras)
         base_coils = 12
         stretch_factor = spring_length / natural_length
-        n_coils = max(5, min(20, int(base_coils * stretch_factor)))
-        
-        t = np.linspace(0, 1, num_points)
-        main_wave = 0.15 * np.sin(n_coils * 2 * np.pi * t)
-        secondary_wave = 0.03 * np.sin(n_coils * 4 * np.pi * t + np.pi/4)
-        tertiary_wave = 0.02 * np.sin(n_coils * 6 * np.pi * t + np.pi/2)
-        
-        y_vals = main_wave + secondary_wave + tertiary_wave
-        
-        # Suavizar extremos
-        window = np.ones(num_points)
-        window[:10] = np.linspace(0, 1, 10)
-        window[-10:] = np.linspace(1, 0, 10)
-        y_vals = y_vals * window
+        n_coils = max(MIN_COILS, min(MAX_COILS, int(base_coils * stretch_factor)))
+        y_vals = self.spring_profiles[n_coils - MIN_COILS]
         
         return x_vals, y_vals
     
-    def update_animation(self, frame, solution_t, solution_y, physics_engine):
-        """Actualizar frame de la animación"""
+    def precompute_frames(self, solution_y):
+        """Precalcular la geometría del resorte para todos los frames de una solución"""
+        return spring_frames(solution_y, self.wall_x, self.equilibrium_x)
+
+    @timed("update_animation")
+    def update_animation(self, frame, solution_t, solution_y, physics_engine, geometry=None):
+        """Actualizar frame de la animación
+
+        Con 'geometry' (de precompute_frames) el resorte solo se indexa.
+        """
         if frame >= len(solution_t):
             return self.spring_line, self.mass, self.graph_line, self.res_text, self.time_line
 
         current_y = solution_y[frame]
-        current_t = solution_t[frame]
 
         # Actualizar resorte y masa
-        spring_x, spring_y = self.create_spring_coords(current_y)
-        self.spring_line.set_data(spring_x, spring_y)
-        self.mass.center = (spring_x[-1], 0)
+        self.draw_system(current_y, frame, physics_engine,
+                         None if geometry is None else geometry[frame])
+        self.update_graph(frame, solution_t, solution_y)
 
-        # Actualizar gráfico
-        self.graph_line.set_data(solution_t[:frame+1], solution_y[:frame+1])
+        return self.spring_line, self.mass, self.graph_line, self.res_text, self.time_line
+
+    def update_graph(self, frame, solution_t, solution_y):
+        """Mostrar la curva de desplazamiento hasta el frame indicado"""
+        current_t = solution_t[frame]
+
+        # Actualizar gráfico: O(1) por frame, sin copiar la historia
+        if self.graph_source is not solution_y:
+            self.set_graph_trajectory(solution_t, solution_y)
+        self.graph_reveal.x1 = current_t
         self.time_line.set_xdata([current_t, current_t])
 
-        # Ajustar límites dinámicos
-        if frame > 10:
-            y_max = max(1, np.max(np.abs(solution_y[:frame+1]))) * 1.2
-            self.ax_graph.set_ylim(-y_max, y_max)
-            self.ax_graph.set_xlim(0, max(20, current_t + 1))
+        # Ajustar límites solo cuando la envolvente cruza un umbral; con histéresis:
+        # dentro de una misma trayectoria solo crecen (los bucles repetidos no redibujan)
+        _, x_max, y_max = self.graph_limits
+        self.set_graph_limits(
+            0, max(x_max, self.frame_x_limits[frame]), max(y_max, self.frame_y_limits[frame])
+        )
+
+    def set_graph_trajectory(self, solution_t, solution_y):
+        """Cargar la curva completa y precalcular los límites por frame"""
+        self.graph_source = solution_y
+        self.graph_line.set_data(solution_t, solution_y)
+        self.frame_x_limits, self.frame_y_limits = graph_limits(solution_t, solution_y)
+        self.set_graph_limits(0, self.frame_x_limits[0], self.frame_y_limits[0])
+
+    def set_graph_limits(self, x_min, x_max, y_max):
+        """Cambiar los límites del gráfico si difieren de los actuales"""
+        limits = (x_min, x_max, y_max)
+        if limits == self.graph_limits:
+            return
+        self.graph_limits = limits
+        self.ax_graph.set_xlim(x_min, x_max)
+        self.ax_graph.set_ylim(-y_max, y_max)
+        self.graph_reveal.x0 = x_min
+        # Los ejes cambiaron: recapturar el fondo en la próxima actualización
+        self.blit_graph.invalidate()
+        self.scheduler.mark_dirty("graph")
+
+    def draw_system(self, current_y, frame, physics_engine, spring_xy=None):
+        """Dibujar resorte, masa e indicador de resonancia para un desplazamiento"""
+        if spring_xy is None:
+            spring_x, spring_y = self.create_spring_coords(current_y)
+        else:
+            spring_x, spring_y = spring_xy[:, 0], spring_xy[:, 1]
+        self.spring_line.set_data(spring_x, spring_y)
+        self.mass.center = (spring_x[-1], 0)
 
         # Actualizar resonancia
         if physics_engine.is_resonance():
@@ -163,27 +327,267 @@ class AnimationManager:
             self.spring_line.set_color("#00D4FF")
             self.mass.set_alpha(1.0)
 
+    def precompute_chain(self, positions):
+        """Precalcular la geometría de la cadena (resortes, masas y perfil) para todos los frames"""
+        length = 2 * (self.equilibrium_x - self.wall_x)
+        return chain_frames(positions, self.wall_x, length,
+                            CHAIN_PROFILE_BASE, CHAIN_PROFILE_HEIGHT)
+
+    def show_chain(self, num_masses=None):
+        """Mostrar la cadena de num_masses masas, o la masa única si es None"""
+        chain = num_masses is not None
+        if chain:
+            spring_points = chain_points_per_spring(num_masses)
+            self.chain_split = 1 + num_masses * spring_points
+            self.chain_line.set_markevery(slice(spring_points, self.chain_split, spring_points))
+            self.chain_line.set_markersize(float(np.clip(120 / num_masses, 1, 8)))
+        if chain == self.chain_line.get_visible():
+            return
+        for artist in (self.spring_line, self.mass, self.equilibrium_line):
+            artist.set_visible(not chain)
+        for artist in (self.chain_line, self.chain_profile):
+            artist.set_visible(chain)
+        if chain:
+            self.res_text.set_text("")
+            self.blit_anim.set_artists([self.chain_line, self.chain_profile])
+        else:
+            self.blit_anim.set_artists([self.spring_line, self.mass, self.res_text])
+        # La línea de equilibrio es parte del fondo
+        self.scheduler.invalidate("anim")
+
+    @timed("update_animation")
+    def update_chain(self, frame, solution_t, solution_y, chain_engine, geometry):
+        """Actualizar un frame de la cadena indexando la geometría precalculada
+
+        solution_y es el desplazamiento de la masa que sigue el gráfico.
+        """
+        split = self.chain_split
+        self.chain_line.set_data(geometry[frame, :split, 0], geometry[frame, :split, 1])
+        self.chain_profile.set_data(geometry[frame, split:, 0], geometry[frame, split:, 1])
+        self.update_graph(frame, solution_t, solution_y)
+        return self.chain_line, self.chain_profile, self.graph_line, self.time_line
+
+    @timed("update_animation")
+    def update_stream_frame(self, frame, sample, physics_engine):
+        """Actualizar un frame en modo continuo (horizonte ilimitado)"""
+        current_t, current_y = sample
+        self.draw_system(current_y, frame, physics_engine)
+
+        # Gráfico: solo la ventana reciente guardada en el búfer circular
+        self.stream_buffer.append(current_t, current_y)
+        self.graph_line.set_data(*self.stream_buffer.view())
+        self.graph_reveal.x1 = current_t
+        self.time_line.set_xdata([current_t, current_t])
+
+        # Desplazar la ventana de tiempo por páginas para no cambiar límites en cada frame
+        x_min, x_max, y_limit = self.graph_limits
+        y_needed = max(1, abs(current_y) * 1.2)
+        if current_t > x_max or y_needed > y_limit:
+            span = x_max - x_min
+            if current_t > x_max:
+                x_min = current_t - span / 2
+            if y_needed > y_limit:
+                # Duplicar el límite evita redibujar en cada frame si la amplitud crece
+                y_limit = max(y_needed, 2 * y_limit)
+            self.set_graph_limits(x_min, x_min + span, y_limit)
+
         return self.spring_line, self.mass, self.graph_line, self.res_text, self.time_line
     
-    def start_animation(self, solution_t, solution_y, physics_engine, interval=25):
-        """Iniciar la animación"""
-        # Detener animación anterior si existe
-        if self.ani:
-            self.ani.event_source.stop()
-        
-        # Crear nueva animación
-        self.ani = FuncAnimation(
-            self.fig_anim,
-            lambda frame: self.update_animation(frame, solution_t, solution_y, physics_engine),
-            frames=len(solution_t),
-            interval=interval,
-            blit=True,
-            repeat=True,
-            cache_frame_data=False,
-        )
-        return self.ani
+    def update_stream_batch(self, frame, samples, physics_engine):
+        """Actualizar en modo continuo consumiendo varias muestras en un tick
+
+        Las muestras saltadas solo se agregan al búfer del gráfico; el sistema
+        se dibuja en la última.
+        """
+        for current_t, current_y in samples[:-1]:
+            self.stream_buffer.append(current_t, current_y)
+        return self.update_stream_frame(frame, samples[-1], physics_engine)
+    
+    def start_animation(self, solution_t, solution_y, physics_engine, interval=25,
+                        precompute=False, realtime=False, speed=1.0,
+                        continue_from_current=False, geometry=None):
+        """Reproducir una trayectoria en bucle
+
+        Con precompute=True la geometría de todos los frames se calcula una vez
+        aquí (o se usa 'geometry' si ya viene calculada, p. ej. desde el hilo de
+        resolución) y cada frame (y cada repetición del bucle) solo la indexa. Con
+        realtime=True cada tick muestra la muestra que corresponde al reloj de
+        pared, saltando las que no alcance a dibujar. Si ya se está
+        reproduciendo una trayectoria en el mismo modo, solo se reemplaza
+        (ver set_trajectory) sin reiniciar el reloj.
+        """
+        continue_from_current = self.prepare_playback(realtime, speed, continue_from_current)
+        self.set_trajectory(solution_t, solution_y, physics_engine, precompute,
+                            continue_from_current, geometry)
+        self.scheduler.start(self.advance_trajectory, interval, adaptive=realtime)
+        return self.scheduler
+    
+    def start_chain(self, solution_t, positions, chain_engine, interval=25, realtime=False,
+                    speed=1.0, continue_from_current=False, geometry=None):
+        """Reproducir en bucle la trayectoria de una cadena de masas
+
+        positions tiene forma (frames, N). Igual que start_animation con
+        precompute=True: la geometría de toda la cadena se calcula una vez (si
+        no viene ya en 'geometry') y cada tick solo la indexa.
+        """
+        continue_from_current = self.prepare_playback(realtime, speed, continue_from_current)
+        self.set_chain_trajectory(solution_t, positions, chain_engine, continue_from_current,
+                                  geometry)
+        self.scheduler.start(self.advance_trajectory, interval, adaptive=realtime)
+        return self.scheduler
+    
+    def prepare_playback(self, realtime, speed, continue_from_current):
+        """Conservar el reloj si ya se reproduce una trayectoria en el mismo modo
+
+        Devuelve si la nueva trayectoria puede continuar desde el instante actual.
+        """
+        playing = (self.scheduler.running and self.scheduler.step == self.advance_trajectory
+                   and realtime == (self.playback_clock is not None))
+        if not playing:
+            self.playback_clock = PlaybackClock(speed) if realtime else None
+        return continue_from_current and playing
+    
+    def set_trajectory(self, solution_t, solution_y, physics_engine, precompute=False,
+                       continue_from_current=False, geometry=None):
+        """Reemplazar la trayectoria en reproducción sin recrear la animación
+
+        El cambio es atómico: el siguiente tick ya usa la nueva trayectoria.
+        Con continue_from_current=True la reproducción sigue en el mismo
+        instante de tiempo; si no, vuelve a empezar desde t = 0.
+        """
+        if precompute and geometry is None:
+            geometry = self.precompute_frames(solution_y)
+        elif not precompute:
+            geometry = None
+        self.show_chain(None)
+        self.swap_trajectory((solution_t, solution_y, geometry), physics_engine,
+                             self.update_animation, continue_from_current)
+    
+    def set_chain_trajectory(self, solution_t, positions, chain_engine,
+                             continue_from_current=False, geometry=None):
+        """Reemplazar la trayectoria en reproducción por la de una cadena de masas
+
+        El gráfico sigue el desplazamiento de la última masa, a la que la onda
+        llega al final.
+        """
+        if geometry is None:
+            geometry = self.precompute_chain(positions)
+        self.show_chain(positions.shape[1])
+        self.swap_trajectory((solution_t, positions[:, -1], geometry), chain_engine,
+                             self.update_chain, continue_from_current)
+    
+    def swap_trajectory(self, trajectory, engine, update, continue_from_current):
+        """Instalar (t, y, geometría) y la función que dibuja cada uno de sus frames"""
+        self.trajectory_engine = engine
+        self.trajectory_update = update
+        self.trajectory = trajectory
+        if not continue_from_current:
+            self.trajectory_frame = None
+            if self.playback_clock is not None:
+                self.playback_clock.restart()
+        elif self.trajectory_frame is not None:
+            self.trajectory_frame = min(self.trajectory_frame, len(trajectory[0]) - 1)
+        # Dibujar ya el frame actual de la nueva trayectoria
+        self.scheduler.mark_dirty()
+    
+    def advance_trajectory(self):
+        """Avanzar la trayectoria en reproducción un tick del reloj"""
+        solution_t, solution_y, geometry = self.trajectory
+        previous = self.trajectory_frame
+        if self.playback_clock is not None:
+            frame = loop_frame(solution_t, self.playback_clock.elapsed())
+        else:
+            frame = 0 if previous is None else (previous + 1) % len(solution_t)
+        if frame == previous and self.graph_source is solution_y:
+            frame = None
+        else:
+            if self.playback_clock is not None:
+                self.playback_clock.record(1 if previous is None else (frame - previous) % len(solution_t))
+            self.trajectory_frame = frame
+        return self.present_frame(frame, self.trajectory_update, solution_t, solution_y,
+                                  self.trajectory_engine, geometry)
+    
+    def start_stream(self, chunks, physics_engine, interval=25, window=800, span=20,
+                     realtime=False, speed=1.0):
+        """Iniciar la animación continua a partir de un generador de fragmentos (t, y)"""
+        self.stream_buffer = RingBuffer(window)
+        self.graph_source = None
+        self.trajectory = None
+        self.show_chain(None)
+        self.set_graph_limits(0, span, 3)
+
+        def samples():
+            for t_chunk, y_chunk in chunks:
+                yield from zip(t_chunk, y_chunk)
+
+        if realtime:
+            self.playback_clock = PlaybackClock(speed)
+            frames = realtime_batches(samples(), self.playback_clock)
+            callback = lambda item: self.update_stream_batch(item[0], item[1], physics_engine)
+        else:
+            self.playback_clock = None
+            frames = enumerate(samples())
+            callback = lambda item: self.update_stream_frame(item[0], item[1], physics_engine)
+        self.run_frames(frames, callback, interval, adaptive=realtime)
+        return self.scheduler
+    
+    def run_frames(self, frames, frame_callback, interval, adaptive=False):
+        """Reproducir una secuencia de frames con el reloj de renderizado
+
+        La secuencia puede producir None cuando en un tick no hay nada nuevo.
+        """
+        self.frames = frames
+        self.frame_callback = frame_callback
+        self.scheduler.start(self.advance_frame, interval, adaptive)
+    
+    def advance_frame(self):
+        """Avanzar un frame; devuelve False cuando la secuencia se agota"""
+        try:
+            frame = next(self.frames)
+        except StopIteration:
+            return False
+        return self.present_frame(frame, self.frame_callback)
+    
+    def present_frame(self, frame, draw, *args):
+        """Dibujar un frame con draw(frame, *args) y marcar los canvas para el tick
+
+        Con frame None no se dibuja nada; el reloj sigue corriendo.
+        """
+        if frame is None:
+            # El reloj aún no llega a la siguiente muestra: no hay nada que redibujar
+            return True
+        draw(frame, *args)
+        self.scheduler.mark_dirty()
+        return True
+    
+    def playback_stats(self):
+        """Frames por segundo, costo por tick y frames omitidos de la reproducción"""
+        stats = self.scheduler.stats()
+        if self.playback_clock is not None:
+            stats["shown"] = self.playback_clock.shown
+            stats["dropped"] = self.playback_clock.dropped
+        return stats
+    
+    def request_redraw(self):
+        """Pedir un redibujo completo de ambos canvas en el próximo tick"""
+        self.scheduler.invalidate()
     
     def stop_animation(self):
         """Detener la animación"""
-        if self.ani:
-            self.ani.event_source.stop()
\ No newline at end of file
+        self.scheduler.stop()
+    
+    def pause_animation(self):
+        """Detener el reloj conservando la reproducción para retomarla con resume_animation"""
+        self.paused = self.scheduler.running
+        self.scheduler.stop()
+        if self.playback_clock is not None:
+            self.playback_clock.pause()
+    
+    def resume_animation(self):
+        """Retomar la reproducción pausada en el mismo instante y redibujar todo"""
+        if self.playback_clock is not None:
+            self.playback_clock.resume()
+        if self.paused:
+            self.paused = False
+            self.scheduler.start(self.scheduler.step, adaptive=self.scheduler.adaptive)
+        self.request_redraw()
@@ -0,0 +1,227 @@
+"""
+Barridos de parámetros sin interfaz gráfica y exportación de trayectorias
+
+No importa tkinter ni matplotlib: solo el motor físico. Las configuraciones
+salen de rangos por parámetro (producto cartesiano) o de un CSV, se resuelven
+por lotes en un pool de procesos y se escriben a medida que terminan.
+
+    python -m src.batch_runner --mass 0.5:2:0.5 --damping 0,0.1,0.5 \\
+        --force-type Coseno Seno --output barrido.npz
+    python -m src.batch_runner --configs configuraciones.csv --output datos.csv.gz
+
+Salida .npz: un arreglo 't', y por cada lote 'parameters_NNNNN' (registros) y
+'y_NNNNN' (trayectorias); load_results() los une. Salida .csv o .csv.gz: una
+fila por configuración con sus parámetros y el desplazamiento en cada instante.
+"""
+
+import argparse
+import csv
+import gzip
+import itertools
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .config import ANIMATION_CONFIG, DEFAULT_PARAMETERS, PHYSICS_CONFIG
+from .physics_engine import PhysicsEngine
+
+NUMERIC_PARAMETERS = ("mass", "stiffness", "damping", "force_amplitude", "frequency")
+FORCE_TYPES = ("Coseno", "Seno", "Pulso", "Escalón")
+
+# Registro de parámetros de cada configuración
+PARAMETER_DTYPE = np.dtype(
+    [(name, "f8") for name in NUMERIC_PARAMETERS] + [("force_type", "U8")]
+)
+
+
+def parse_values(spec):
+    """Valores de un parámetro: 'inicio:fin:paso' (fin incluido), 'a,b,c' o 'a'"""
+    if ":" in spec:
+        start, stop, step = (float(part) for part in spec.split(":"))
+        if step <= 0:
+            raise ValueError(f"Paso no positivo en '{spec}'")
+        return list(np.round(np.arange(start, stop + step / 2, step), 10))
+    return [float(part) for part in spec.split(",")]
+
+
+def grid_configurations(ranges, force_types):
+    """Producto cartesiano de los valores de cada parámetro y tipo de fuerza"""
+    values = [ranges.get(name, [DEFAULT_PARAMETERS[name]]) for name in NUMERIC_PARAMETERS]
+    combos = list(itertools.product(*values, force_types))
+    return np.array(combos, dtype=PARAMETER_DTYPE)
+
+
+def read_configurations(path):
+    """Configuraciones desde un CSV con columnas de parámetros (las ausentes toman el valor por defecto)"""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [
+            tuple(float(row.get(name) or DEFAULT_PARAMETERS[name]) for name in NUMERIC_PARAMETERS)
+            + ((row.get("force_type") or DEFAULT_PARAMETERS["force_type"]).strip(),)
+            for row in csv.DictReader(f)
+        ]
+    configurations = np.array(rows, dtype=PARAMETER_DTYPE)
+    unknown = set(configurations["force_type"]) - set(FORCE_TYPES)
+    if unknown:
+        raise ValueError(f"Tipos de fuerza desconocidos: {', '.join(sorted(unknown))}")
+    return configurations
+
+
+def solve_chunk(configurations, t_max, num_points, method):
+    """Resolver un lote de configuraciones (se ejecuta en los procesos del pool)"""
+    engine = PhysicsEngine(method=method)
+    return engine.solve_batch(
+        *(configurations[name] for name in NUMERIC_PARAMETERS),
+        configurations["force_type"].astype(object),
+        t_max=t_max, num_points=num_points
+    )
+
+
+def _solve_chunk_args(args):
+    """Adaptador de solve_chunk para executor.map"""
+    return solve_chunk(*args)
+
+
+class NpzWriter:
+    """Escribe lotes en un .npz comprimido a medida que llegan"""
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self.chunks = 0
+
+    def _write_array(self, name, array):
+        with self.archive.open(f"{name}.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, np.asanyarray(array), allow_pickle=False)
+
+    def write(self, configurations, t, displacement):
+        if self.chunks == 0:
+            self._write_array("t", t)
+        self._write_array(f"parameters_{self.chunks:05d}", configurations)
+        self._write_array(f"y_{self.chunks:05d}", displacement)
+        self.chunks += 1
+
+    def close(self):
+        self.archive.close()
+
+
+class CsvWriter:
+    """Escribe una fila por configuración (comprimido con gzip si termina en .gz)"""
+
+    def __init__(self, path):
+        if path.endswith(".gz"):
+            self.file = gzip.open(path, "wt", newline="", encoding="utf-8")
+        else:
+            self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.header_written = False
+
+    def write(self, configurations, t, displacement):
+        if not self.header_written:
+            self.writer.writerow(
+                list(PARAMETER_DTYPE.names) + [f"y@{value:.4f}" for value in t]
+            )
+            self.header_written = True
+        for configuration, row in zip(configurations, displacement):
+            self.writer.writerow(
+                [configuration[name] for name in PARAMETER_DTYPE.names]
+                + [f"{value:.6g}" for value in row]
+            )
+
+    def close(self):
+        self.file.close()
+
+
+def open_writer(path):
+    """Escritor según la extensión del archivo de salida"""
+    if path.endswith(".npz"):
+        return NpzWriter(path)
+    if path.endswith((".csv", ".csv.gz")):
+        return CsvWriter(path)
+    raise ValueError(f"Formato de salida no soportado: {path} (usa .npz, .csv o .csv.gz)")
+
+
+def load_results(path):
+    """Leer un .npz de salida como (t, parámetros, Y) con los lotes unidos"""
+    with np.load(path) as data:
+        chunks = sorted(name[len("y_"):] for name in data.files if name.startswith("y_"))
+        parameters = np.concatenate([data[f"parameters_{chunk}"] for chunk in chunks])
+        displacement = np.concatenate([data[f"y_{chunk}"] for chunk in chunks])
+        return data["t"], parameters, displacement
+
+
+def run_batch(configurations, output, t_max=None, num_points=None, method=None,
+              chunk_size=256, workers=None, progress=None):
+    """Resolver todas las configuraciones y escribirlas en 'output' lote a lote"""
+    t_max = ANIMATION_CONFIG["simulation_time"] if t_max is None else t_max
+    num_points = ANIMATION_CONFIG["frames"] if num_points is None else num_points
+    method = PHYSICS_CONFIG["solver_method"] if method is None else method
+    workers = os.cpu_count() if workers is None else workers
+
+    chunks = [configurations[start:start + chunk_size]
+              for start in range(0, len(configurations), chunk_size)]
+    jobs = [(chunk, t_max, num_points, method) for chunk in chunks]
+
+    writer = open_writer(output)
+    try:
+        if workers > 1 and len(chunks) > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(_solve_chunk_args, jobs)
+        else:
+            executor = None
+            results = map(_solve_chunk_args, jobs)
+        try:
+            done = 0
+            # map conserva el orden: cada lote se escribe en cuanto están listos los anteriores
+            for chunk, (t, displacement) in zip(chunks, results):
+                writer.write(chunk, t, displacement)
+                done += len(chunk)
+                if progress:
+                    progress(done, len(configurations))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    finally:
+        writer.close()
+    return output
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Barridos de parámetros del sistema masa-resorte sin interfaz gráfica"
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--configs", help="CSV con una configuración por fila")
+    for name in NUMERIC_PARAMETERS:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, metavar="VALORES",
+                            help="inicio:fin:paso, lista a,b,c o un valor")
+    parser.add_argument("--force-type", nargs="+", default=[DEFAULT_PARAMETERS["force_type"]],
+                        choices=FORCE_TYPES)
+    parser.add_argument("--output", required=True, help="archivo .npz, .csv o .csv.gz")
+    parser.add_argument("--t-max", type=float, default=None)
+    parser.add_argument("--num-points", type=int, default=None)
+    parser.add_argument("--method", default=None)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.configs:
+        configurations = read_configurations(args.configs)
+    else:
+        ranges = {name: parse_values(getattr(args, name))
+                  for name in NUMERIC_PARAMETERS if getattr(args, name) is not None}
+        configurations = grid_configurations(ranges, args.force_type)
+
+    def report(done, total):
+        sys.stderr.write(f"\r{done}/{total} configuraciones ({100 * done / total:.1f}%)")
+        sys.stderr.flush()
+
+    run_batch(configurations, args.output, args.t_max, args.num_points, args.method,
+              args.chunk_size, args.workers, progress=report)
+    sys.stderr.write(f"\nResultados guardados en {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Renderizado por blitting con fondo cacheado por canvas
+"""
+
+from .perf_monitor import monitor
+
+
+class BlitManager:
+    """Redibuja solo los artistas animados sobre el fondo cacheado de un canvas
+
+    El fondo (ejes, rejilla, textos fijos) se copia con copy_from_bbox después
+    de cada dibujo completo. Entre dibujos completos, cada actualización
+    restaura el fondo, dibuja los artistas animados y hace blit. Basta llamar
+    invalidate() cuando cambia algo del fondo (p. ej. los límites de los ejes).
+    """
+
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+        self.set_artists(artists)
+        # Cualquier dibujo completo (redimensionar, exponer, draw()) recaptura el fondo
+        self.draw_cid = canvas.mpl_connect("draw_event", self.on_draw)
+
+    def set_artists(self, artists):
+        """Reemplazar los artistas animados (p. ej. tras limpiar unos ejes)"""
+        for artist in self.artists:
+            artist.set_animated(False)
+        self.artists = list(artists)
+        for artist in self.artists:
+            artist.set_animated(True)
+        self.background = None
+
+    def on_draw(self, event):
+        """Capturar el fondo tras un dibujo completo y pintar encima los artistas"""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        if self.canvas.supports_blit:
+            self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_artists()
+
+    def invalidate(self):
+        """Marcar el fondo como obsoleto: la próxima actualización lo redibuja"""
+        self.background = None
+
+    def draw_artists(self):
+        """Dibujar los artistas animados sobre el estado actual del canvas"""
+        figure = self.canvas.figure
+        for artist in self.artists:
+            figure.draw_artist(artist)
+
+    def update(self):
+        """Actualizar el canvas redibujando solo lo que cambia"""
+        if self.background is None or not self.canvas.supports_blit:
+            # Dibujo completo: dispara on_draw, que recaptura el fondo
+            self.canvas.draw()
+            monitor.count("full_draws")
+        else:
+            self.canvas.restore_region(self.background)
+            self.draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def disconnect(self):
+        """Dejar de escuchar los eventos de dibujo del canvas"""
+        self.canvas.mpl_disconnect(self.draw_cid)
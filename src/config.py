@@ -69,7 +69,61 @@ ANIMATION_CONFIG = {
     "interval": 25,      # ms entre frames
     "frames": 800,       # número de frames
     "simulation_time": 17,  # segundos
-    "blit": True
+    "blit": True,
+    "precompute_geometry": True,  # geometría de todos los frames al recibir la solución
+    "streaming": False,  # simulación continua sin límite de tiempo
+    "stream_chunk": 40,  # muestras calculadas por adelantado en modo continuo
+    "realtime": True,    # sincronizar con el reloj de pared saltando frames si hace falta
+    "playback_speed": 1.0,  # segundos simulados por segundo real
+    "max_interval": 100,  # ms máximos entre frames al adaptar la tasa al costo de dibujo
+    "report_ms": 1000,   # intervalo de actualización de las estadísticas de reproducción
+    "continue_on_update": False,  # al cambiar parámetros, seguir desde el instante actual
+}
+
+# Configuración del motor físico
+PHYSICS_CONFIG = {
+    "solver_method": "auto",  # "auto", "analytic", "exact" o un método de solve_ivp
+    "cache_bytes": 32 * 1024 * 1024,  # memoria máxima de la caché de trayectorias
+    "debounce_ms": 40,  # espera tras el último cambio antes de resolver
+    "poll_ms": 15,  # intervalo de revisión de soluciones listas
+    "atlas_path": None,  # directorio de un atlas precalculado (python -m src.trajectory_atlas)
+    "worker_backend": "thread",  # "thread" o "process" (trayectorias por memoria compartida)
+}
+
+# Curva de resonancia
+RESONANCE_CONFIG = {
+    "steady_points": 2000,  # frecuencias de la curva estacionaria
+    "peak_points": 200,  # frecuencias del pico con transitorio (requiere resolver en el tiempo)
+    "debounce_ms": 60,  # espera tras el último cambio antes de recalcular
+}
+
+# Cadena de N masas (propagación de ondas)
+CHAIN_CONFIG = {
+    "enabled": False,  # iniciar en modo cadena
+    "num_masses": 40,  # masas iniciales (cada una con la masa, rigidez y amortiguamiento del panel)
+    "max_masses": 2000,
+    "solver_method": "RK45",  # explícito O(N) por paso; Radau/BDF usan el jacobiano disperso
+}
+
+# Capturas de las gráficas
+SNAPSHOT_CONFIG = {
+    "directory": "capturas",  # carpeta de las capturas (las ráfagas van en subcarpetas)
+    "max_pending": 8,  # capturas en cola para guardar; con la cola llena se descartan
+    "burst_interval_ms": 500,  # intervalo entre capturas de una ráfaga (secuencias time-lapse)
+    "burst_frames": 120,  # capturas máximas por ráfaga
+    "poll_ms": 100,  # intervalo de revisión de capturas guardadas
+}
+
+# Arranque
+STARTUP_CONFIG = {
+    "prewarm": True,  # importar matplotlib/scipy en segundo plano durante la bienvenida
+    "prewarm_delay_ms": 200,  # espera tras mostrar la bienvenida antes de precargar
+}
+
+# Instrumentación de rendimiento
+PERF_CONFIG = {
+    "enabled": False,  # medir desde el inicio (también se activa desde la interfaz)
+    "dump_path": None,  # archivo JSON donde guardar las mediciones al salir
 }
 
 # Consejos del sistema
@@ -4,24 +4,51 @@ Aplicación principal del simulador masa-resorte (versión modular)
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import datetime
-from io import BytesIO
+import os
+import time
 
 from .physics_engine import PhysicsEngine
+from .chain_engine import ChainEngine
+from .trajectory_cache import TrajectoryCache
+from .trajectory_atlas import TrajectoryAtlas
+from .solve_worker import SolveWorker, ProcessSolveWorker
 from .animation_manager import AnimationManager
+from .resonance_plot import ResonanceCurve
+from .perf_monitor import monitor, timed
+from .snapshot_worker import SnapshotWorker, capture_canvases
 from .ui_components import ControlPanel, InfoPanel
-from .config import COLORS, DEFAULT_PARAMETERS, PARAMETER_LIMITS, PRESETS, ANIMATION_CONFIG, TIPS
+from .config import COLORS, DEFAULT_PARAMETERS, PARAMETER_LIMITS, PRESETS, ANIMATION_CONFIG, PHYSICS_CONFIG, RESONANCE_CONFIG, CHAIN_CONFIG, PERF_CONFIG, SNAPSHOT_CONFIG, TIPS
 
 class MassSpringApp:
-    def __init__(self, root):
+    def __init__(self, root, on_home=None):
+        # Ventana compartida con la bienvenida: el laboratorio es un frame que
+        # se oculta y se vuelve a mostrar, conservando figuras, motores y cachés
         self.root = root
+        self.on_home = on_home
+        self.frame = None
         self.setup_window()
         
         # Inicializar componentes
-        self.physics_engine = PhysicsEngine()
+        self.physics_engine = PhysicsEngine(method=PHYSICS_CONFIG["solver_method"])
+        self.chain_engine = ChainEngine(method=CHAIN_CONFIG["solver_method"])
+        self.solve_worker = self.create_solve_worker()
+        self.solve_debounce = None
+        self.solve_poller = None
+        self.solve_requested = None
+        self.resonance_debounce = None
+        self.resonance_curve = None
+        self.resonance_worker = None
+        self.update_on_resume = False
+        # Capturas: composición y PNG en un hilo aparte
+        self.snapshot_worker = SnapshotWorker(SNAPSHOT_CONFIG["max_pending"])
+        self.snapshot_poller = None
+        self.burst = None
+        self.burst_timer = None
+        monitor.set_enabled(PERF_CONFIG["enabled"])
+        self.playback_reporter = None
         self.animation_manager = None
         self.info_panel = None
         self.control_panels = {}
@@ -39,6 +66,34 @@ class MassSpringApp:
         self.initialize_simulation()
         self.setup_automatic_tips()
     
+    def create_solve_worker(self):
+        """Hilo o proceso de resolución, con sus propios motores, según la configuración"""
+        precompute = ANIMATION_CONFIG["precompute_geometry"]
+        if PHYSICS_CONFIG["worker_backend"] == "process":
+            # Las trayectorias vuelven por memoria compartida, sin copias
+            return ProcessSolveWorker({
+                "method": PHYSICS_CONFIG["solver_method"],
+                "cache_bytes": PHYSICS_CONFIG["cache_bytes"],
+                "atlas_path": PHYSICS_CONFIG["atlas_path"],
+                "chain_method": CHAIN_CONFIG["solver_method"],
+            }, precompute=precompute)
+        return SolveWorker(PhysicsEngine(
+            method=PHYSICS_CONFIG["solver_method"],
+            cache=TrajectoryCache(PHYSICS_CONFIG["cache_bytes"]),
+            atlas=self.load_atlas()
+        ), ChainEngine(method=CHAIN_CONFIG["solver_method"]), precompute=precompute)
+    
+    def load_atlas(self):
+        """Abrir el atlas precalculado si está configurado"""
+        path = PHYSICS_CONFIG["atlas_path"]
+        if not path or not os.path.isdir(path):
+            return None
+        try:
+            return TrajectoryAtlas(path)
+        except (OSError, ValueError) as e:
+            print(f"No se pudo abrir el atlas '{path}': {e}")
+            return None
+    
     def setup_window(self):
         """Configurar ventana principal"""
         self.root.title("🔬 LABORATORIO VIRTUAL - Sistema Masa-Resorte")
@@ -83,7 +138,7 @@ class MassSpringApp:
     
     def setup_gui(self):
         """Configurar la interfaz gráfica"""
-        main_frame = ttk.Frame(self.root, style="Main.TFrame", padding=10)
+        main_frame = self.frame = ttk.Frame(self.root, style="Main.TFrame", padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Dividir en 2 filas principales
@@ -147,6 +202,27 @@ class MassSpringApp:
 
         self.canvas_graph = FigureCanvasTkAgg(self.fig_graph, graph_frame)
         self.canvas_graph.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Curva de resonancia
+        resonance_frame = tk.Frame(
+            graph_container, bg=COLORS["secondary"], relief="ridge", bd=2, padx=10, pady=1
+        )
+        resonance_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=2)
+
+        resonance_title = tk.Label(
+            resonance_frame,
+            text="📈 CURVA DE RESONANCIA",
+            bg=COLORS["secondary"],
+            fg=COLORS["accent4"],
+            font=("Arial", 11, "bold"),
+        )
+        resonance_title.pack(pady=1)
+
+        self.fig_resonance = Figure(figsize=(4.5, 3), facecolor=COLORS["secondary"])
+        self.ax_resonance = self.fig_resonance.add_subplot(111)
+
+        self.canvas_resonance = FigureCanvasTkAgg(self.fig_resonance, resonance_frame)
+        self.canvas_resonance.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
     def setup_controls(self, parent):
         """Configurar área de controles e información"""
@@ -376,6 +452,19 @@ class MassSpringApp:
             font=("Arial", 9, "bold"),
             command=self.take_snapshot
         ).pack(side=tk.LEFT, padx=2)
+        
+        # Ráfaga de capturas a intervalos (time-lapse)
+        self.burst_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            action_frame,
+            text="🎞️ Ráfaga",
+            variable=self.burst_var,
+            command=self.on_burst_toggle,
+            bg=COLORS["secondary"],
+            fg="white",
+            selectcolor=COLORS["accent1"],
+            font=("Arial", 9, "bold"),
+        ).pack(side=tk.LEFT, padx=2)
 
         # Botón Reiniciar
         tk.Button(
@@ -387,6 +476,57 @@ class MassSpringApp:
             command=self.on_reset
         ).pack(side=tk.LEFT, padx=2)
         
+        # Modo continuo (horizonte ilimitado)
+        self.streaming_var = tk.BooleanVar(value=ANIMATION_CONFIG["streaming"])
+        tk.Checkbutton(
+            action_frame,
+            text="♾️ Continuo",
+            variable=self.streaming_var,
+            command=self.on_streaming_toggle,
+            bg=COLORS["secondary"],
+            fg="white",
+            selectcolor=COLORS["accent1"],
+            font=("Arial", 9, "bold"),
+        ).pack(side=tk.LEFT, padx=2)
+        
+        # Cadena de N masas (propagación de ondas)
+        self.chain_var = tk.BooleanVar(value=CHAIN_CONFIG["enabled"])
+        tk.Checkbutton(
+            action_frame,
+            text="🔗 Cadena",
+            variable=self.chain_var,
+            command=self.on_chain_toggle,
+            bg=COLORS["secondary"],
+            fg="white",
+            selectcolor=COLORS["accent1"],
+            font=("Arial", 9, "bold"),
+        ).pack(side=tk.LEFT, padx=2)
+        self.chain_size_var = tk.IntVar(value=CHAIN_CONFIG["num_masses"])
+        chain_size = tk.Spinbox(
+            action_frame,
+            from_=2,
+            to=CHAIN_CONFIG["max_masses"],
+            textvariable=self.chain_size_var,
+            command=self.on_chain_size_change,
+            width=5,
+            font=("Arial", 9),
+        )
+        chain_size.bind("<Return>", lambda e: self.on_chain_size_change())
+        chain_size.pack(side=tk.LEFT, padx=2)
+        
+        # Mediciones de rendimiento (solver, matplotlib, Tk)
+        self.perf_var = tk.BooleanVar(value=PERF_CONFIG["enabled"])
+        tk.Checkbutton(
+            action_frame,
+            text="⏱️ Rendimiento",
+            variable=self.perf_var,
+            command=self.on_perf_toggle,
+            bg=COLORS["secondary"],
+            fg="white",
+            selectcolor=COLORS["accent1"],
+            font=("Arial", 9, "bold"),
+        ).pack(side=tk.LEFT, padx=2)
+        
         # Botón Volver al Inicio
         tk.Button(
             action_frame,
@@ -409,28 +549,37 @@ class MassSpringApp:
 
     def initialize_simulation(self):
         """Inicializar la simulación"""
-        # Configurar motor físico
+        # Configurar motores físicos
         self.physics_engine.set_parameters(**self.current_params)
+        self.chain_engine.set_parameters(**self.chain_params())
         
         # Configurar gestor de animaciones
         self.animation_manager = AnimationManager(
-            self.fig_anim, self.ax_anim, self.fig_graph, self.ax_graph
+            self.fig_anim, self.ax_anim, self.fig_graph, self.ax_graph,
+            max_interval=ANIMATION_CONFIG["max_interval"]
         )
         
-        # Resolver sistema inicial - USAR simulation_time de CONFIG
-        self.solution_t, self.solution_y = self.physics_engine.solve_system(
-            t_max=ANIMATION_CONFIG["simulation_time"],
-            num_points=ANIMATION_CONFIG["frames"]
+        # Curva de resonancia para los parámetros iniciales
+        self.resonance_curve = ResonanceCurve(
+            self.fig_resonance, self.ax_resonance,
+            (PARAMETER_LIMITS["frequency"]["min"], PARAMETER_LIMITS["frequency"]["max"]),
+            steady_points=RESONANCE_CONFIG["steady_points"],
+            peak_points=RESONANCE_CONFIG["peak_points"]
         )
+        # Los picos con transitorio (~25 ms) se calculan en su propio hilo
+        self.resonance_worker = SolveWorker(PhysicsEngine(), solve=self.resonance_curve.solve_peaks)
+        self.update_resonance_curve()
         
-        # Iniciar animación - USAR interval de CONFIG
-        self.animation_manager.start_animation(
-            self.solution_t, self.solution_y, self.physics_engine,
-            interval=ANIMATION_CONFIG["interval"]
-        )
+        # Resolver sistema inicial en segundo plano; la animación arranca al llegar el resultado
+        if self.streaming_var.get():
+            self.start_stream()
+        else:
+            self.request_solve()
+        self.poll_solutions()
         
-        # Actualizar información inicial
-        self.update_info_panel()
+        # Actualizar información inicial (incluye estadísticas de reproducción periódicas)
+        self.info_panel.show_perf(self.perf_var.get())
+        self.report_playback()
         
         # Mostrar consejo inicial
         self.info_panel.update_tips("¡Bienvenido! Ajusta los parámetros y observa el comportamiento del sistema 🎯")
@@ -464,31 +613,182 @@ class MassSpringApp:
         self.info_panel.update_tips(f"Experimento: {preset_name}\n¡Observa el comportamiento del sistema!")
         self.update_simulation()
     
+    def chain_params(self):
+        """Parámetros de la cadena: los del panel, iguales para cada masa y resorte"""
+        try:
+            num_masses = int(self.chain_size_var.get())
+        except (tk.TclError, ValueError):
+            num_masses = CHAIN_CONFIG["num_masses"]
+        return dict(self.current_params,
+                    num_masses=max(2, min(num_masses, CHAIN_CONFIG["max_masses"])))
+    
+    def on_chain_toggle(self):
+        """Alternar entre una sola masa y la cadena de masas"""
+        if self.chain_var.get():
+            # La cadena se reproduce como trayectoria en bucle
+            if self.streaming_var.get():
+                self.streaming_var.set(False)
+                self.stop_stream()
+            self.info_panel.update_tips(
+                "🔗 Cadena: la fuerza empuja la primera masa y la onda viaja hasta el extremo libre"
+            )
+        self.update_simulation()
+    
+    def on_chain_size_change(self):
+        """Cuando cambia el número de masas de la cadena"""
+        if self.chain_var.get():
+            self.update_simulation()
+    
+    @timed("update_simulation")
     def update_simulation(self):
         """Actualizar toda la simulación"""
-        # Actualizar motor físico
+        # Actualizar motores físicos
         self.physics_engine.set_parameters(**self.current_params)
+        if self.chain_var.get():
+            self.chain_engine.set_parameters(**self.chain_params())
         
-        # Resolver sistema
-        self.solution_t, self.solution_y = self.physics_engine.solve_system()
-        
-        # Reiniciar animación
-        self.animation_manager.start_animation(
-            self.solution_t, self.solution_y, self.physics_engine
+        # Recalcular la curva de resonancia tras una breve pausa sin cambios
+        if self.resonance_debounce:
+            self.root.after_cancel(self.resonance_debounce)
+        self.resonance_debounce = self.root.after(
+            RESONANCE_CONFIG["debounce_ms"], self.update_resonance_curve
         )
         
-        # Redibujar canvas
-        self.canvas_anim.draw()
-        self.canvas_graph.draw()
+        # En modo continuo el generador toma los nuevos parámetros en el próximo fragmento
+        if self.streaming_var.get():
+            self.update_info_panel()
+            return
+        
+        # Resolver sistema tras una breve pausa sin cambios (agrupa clics rápidos)
+        if self.solve_debounce:
+            self.root.after_cancel(self.solve_debounce)
+        self.solve_debounce = self.root.after(PHYSICS_CONFIG["debounce_ms"], self.request_solve)
         
         # Actualizar información
         self.update_info_panel()
     
+    def update_resonance_curve(self):
+        """Actualizar la curva de resonancia con los parámetros actuales"""
+        self.resonance_debounce = None
+        t_max, num_points = ANIMATION_CONFIG["simulation_time"], ANIMATION_CONFIG["frames"]
+        if self.resonance_curve.update(self.physics_engine, t_max=t_max, num_points=num_points):
+            self.resonance_worker.submit(self.current_params, t_max, num_points)
+    
+    def request_solve(self):
+        """Enviar los parámetros actuales al hilo de resolución"""
+        self.solve_debounce = None
+        self.solve_requested = time.perf_counter()
+        self.solve_worker.submit(
+            self.chain_params() if self.chain_var.get() else self.current_params,
+            t_max=ANIMATION_CONFIG["simulation_time"],
+            num_points=ANIMATION_CONFIG["frames"]
+        )
+    
+    def poll_solutions(self):
+        """Revisar periódicamente si hay una solución nueva lista"""
+        result = self.solve_worker.poll()
+        if result is not None and not self.streaming_var.get():
+            _, parameters, solution_t, solution_y, geometry = result
+            # Latencia completa: desde el pedido hasta tener la solución en Tk
+            monitor.record("solve_latency", time.perf_counter() - self.solve_requested)
+            if "num_masses" in parameters:
+                self.apply_chain_solution(solution_t, solution_y, geometry)
+            else:
+                self.apply_solution(solution_t, solution_y, geometry)
+        peaks = self.resonance_worker.poll()
+        if peaks is not None:
+            self.resonance_curve.set_peaks(peaks[3])
+        self.solve_poller = self.root.after(PHYSICS_CONFIG["poll_ms"], self.poll_solutions)
+    
+    def apply_solution(self, solution_t, solution_y, geometry=None):
+        """Mostrar una solución recién calculada (con su geometría, si ya viene precalculada)"""
+        self.solution_t, self.solution_y = solution_t, solution_y
+        
+        # Reemplazar la trayectoria de la animación en curso (o iniciarla)
+        self.animation_manager.start_animation(
+            self.solution_t, self.solution_y, self.physics_engine,
+            interval=ANIMATION_CONFIG["interval"],
+            precompute=ANIMATION_CONFIG["precompute_geometry"],
+            realtime=ANIMATION_CONFIG["realtime"],
+            speed=ANIMATION_CONFIG["playback_speed"],
+            continue_from_current=ANIMATION_CONFIG["continue_on_update"],
+            geometry=geometry
+        )
+    
+    def apply_chain_solution(self, solution_t, positions, geometry=None):
+        """Mostrar una solución recién calculada de la cadena (posiciones de forma (frames, N))"""
+        self.solution_t, self.solution_y = solution_t, positions
+        self.animation_manager.start_chain(
+            solution_t, positions, self.chain_engine,
+            interval=ANIMATION_CONFIG["interval"],
+            realtime=ANIMATION_CONFIG["realtime"],
+            speed=ANIMATION_CONFIG["playback_speed"],
+            continue_from_current=ANIMATION_CONFIG["continue_on_update"],
+            geometry=geometry
+        )
+    
+    def on_streaming_toggle(self):
+        """Alternar entre trayectoria en bucle y simulación continua"""
+        if self.streaming_var.get():
+            self.chain_var.set(False)
+            self.start_stream()
+            self.info_panel.update_tips("♾️ Modo continuo: la simulación avanza sin límite de tiempo")
+        else:
+            self.stop_stream()
+            self.request_solve()
+    
+    def stop_stream(self):
+        """Detener la simulación continua y reiniciar el gráfico
+
+        La reproducción vuelve a arrancar, en bucle, cuando apply_solution
+        recibe la siguiente solución.
+        """
+        self.animation_manager.stop_animation()
+        self.animation_manager.setup_graph_plot()
+    
+    def start_stream(self):
+        """Iniciar la simulación continua desde el reposo"""
+        dt = ANIMATION_CONFIG["simulation_time"] / (ANIMATION_CONFIG["frames"] - 1)
+        span = 20
+        self.animation_manager.setup_graph_plot()
+        self.animation_manager.start_stream(
+            self.physics_engine.stream(dt, ANIMATION_CONFIG["stream_chunk"]),
+            self.physics_engine,
+            interval=ANIMATION_CONFIG["interval"],
+            window=int(span / dt) + 1,
+            span=span,
+            realtime=ANIMATION_CONFIG["realtime"],
+            speed=ANIMATION_CONFIG["playback_speed"]
+        )
+        self.animation_manager.request_redraw()
+    
     def update_info_panel(self):
         """Actualizar panel de información"""
-        system_info = self.physics_engine.get_system_info()
+        if self.chain_var.get():
+            system_info = self.chain_engine.get_system_info()
+        else:
+            system_info = self.physics_engine.get_system_info()
+        if self.animation_manager and self.animation_manager.playback_clock:
+            stats = self.animation_manager.playback_stats()
+            system_info += (f"\n🎞️ {stats['fps']:.0f} fps · "
+                            f"{stats['dropped']} frames omitidos")
         self.info_panel.update_system_info(system_info)
     
+    def report_playback(self):
+        """Refrescar periódicamente las estadísticas de reproducción y de rendimiento"""
+        self.update_info_panel()
+        if self.perf_var.get():
+            self.info_panel.update_perf(monitor.format_summary())
+        self.playback_reporter = self.root.after(ANIMATION_CONFIG["report_ms"], self.report_playback)
+    
+    def on_perf_toggle(self):
+        """Activar o desactivar las mediciones de rendimiento y su panel"""
+        enabled = self.perf_var.get()
+        monitor.set_enabled(enabled)
+        self.info_panel.show_perf(enabled)
+        if enabled:
+            self.info_panel.update_perf(monitor.format_summary())
+    
     def on_reset(self):
         """Reiniciar el sistema"""
         # Restablecer parámetros por defecto
@@ -526,88 +826,154 @@ class MassSpringApp:
             self.current_tip_index = (self.current_tip_index + 1) % len(self.tips)
     
     def take_snapshot(self):
-        """Tomar captura del estado actual"""
-        try:
-            from PIL import ImageGrab, Image
-        except ImportError:
-            self.info_panel.update_tips("❌ Error: PIL no está instalado. Ejecuta: pip install pillow")
+        """Capturar las gráficas; la imagen se compone y se guarda en segundo plano"""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        filename = f"snapshot_m{self.current_params['mass']}_k{self.current_params['stiffness']}_c{self.current_params['damping']}_{timestamp}.png"
+        if self.queue_snapshot(os.path.join(SNAPSHOT_CONFIG["directory"], filename)):
+            self.info_panel.show_notice("📸 Guardando captura...")
+        else:
+            self.info_panel.show_notice("⚠️ Hay demasiadas capturas pendientes; inténtalo en un momento")
+    
+    def queue_snapshot(self, path):
+        """Leer los búferes de los canvas y encolar la captura; False si la cola está llena"""
+        images = capture_canvases((self.canvas_anim, self.canvas_resonance, self.canvas_graph))
+        if not self.snapshot_worker.submit(images, path):
+            return False
+        if self.snapshot_poller is None:
+            self.snapshot_poller = self.root.after(SNAPSHOT_CONFIG["poll_ms"], self.poll_snapshots)
+        return True
+    
+    def poll_snapshots(self):
+        """Avisar de las capturas ya guardadas mientras queden pendientes"""
+        self.snapshot_poller = None
+        for path, error in self.snapshot_worker.poll():
+            if error is not None:
+                self.info_panel.show_notice(f"❌ Error al guardar captura: {error}")
+            elif self.burst and os.path.dirname(path) == self.burst["directory"]:
+                self.burst["saved"] += 1
+                self.info_panel.show_notice(
+                    f"🎞️ Ráfaga: {self.burst['saved']}/{self.burst['taken']} capturas en {self.burst['directory']}"
+                )
+            else:
+                self.info_panel.show_notice(f"📸 Captura guardada: {path}")
+        if self.snapshot_worker.pending:
+            self.snapshot_poller = self.root.after(SNAPSHOT_CONFIG["poll_ms"], self.poll_snapshots)
+    
+    def on_burst_toggle(self):
+        """Iniciar o detener una ráfaga de capturas a intervalos (secuencia time-lapse)"""
+        if not self.burst_var.get():
+            self.stop_burst()
             return
-        
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"snapshot_m{self.current_params['mass']}_k{self.current_params['stiffness']}_c{self.current_params['damping']}_{timestamp}.png"
-
-        try:
-            # Intentar capturar ventana completa
-            self.root.update()
-            x = self.root.winfo_rootx()
-            y = self.root.winfo_rooty()
-            w = self.root.winfo_width()
-            h = self.root.winfo_height()
-
-            bbox = (x, y, x + w, y + h)
-            img = ImageGrab.grab(bbox)
-            img.save(f"snapshot_{filename}", quality=95)
-            
-            self.info_panel.update_tips(f"📸 Captura guardada: snapshot_{filename}")
-            
-        except Exception as e:
-            # Fallback: guardar solo las figuras
-            try:
-                buf_anim = BytesIO()
-                buf_graph = BytesIO()
-                self.fig_anim.savefig(buf_anim, dpi=150, facecolor=self.fig_anim.get_facecolor(), bbox_inches='tight')
-                self.fig_graph.savefig(buf_graph, dpi=150, facecolor=self.fig_graph.get_facecolor(), bbox_inches='tight')
-
-                buf_anim.seek(0)
-                buf_graph.seek(0)
-                img1 = Image.open(buf_anim).convert("RGBA")
-                img2 = Image.open(buf_graph).convert("RGBA")
-
-                # Combinar imágenes
-                target_h = max(img1.height, img2.height)
-                img1 = img1.resize((int(img1.width * target_h / img1.height), target_h), Image.LANCZOS)
-                img2 = img2.resize((int(img2.width * target_h / img2.height), target_h), Image.LANCZOS)
-
-                gap = 20
-                new_img = Image.new("RGBA", (img1.width + img2.width + gap, target_h), (26, 30, 46, 255))
-                new_img.paste(img1, (0, 0))
-                new_img.paste(img2, (img1.width + gap, 0))
-
-                new_img.convert("RGB").save(f"snapshot_{filename}", quality=95)
-                self.info_panel.update_tips(f"📸 Captura combinada guardada: snapshot_{filename}")
-                
-            except Exception as e2:
-                self.info_panel.update_tips(f"❌ Error al guardar captura: {str(e2)}")
+        self.burst = {
+            "directory": os.path.join(SNAPSHOT_CONFIG["directory"], f"rafaga_{timestamp}"),
+            "taken": 0, "saved": 0, "dropped": 0, "active": True,
+        }
+        self.capture_burst_frame()
+    
+    def capture_burst_frame(self):
+        """Tomar la siguiente captura de la ráfaga y programar la próxima"""
+        self.burst_timer = None
+        burst = self.burst
+        path = os.path.join(burst["directory"], f"frame_{burst['taken']:04d}.png")
+        if self.queue_snapshot(path):
+            burst["taken"] += 1
+        else:
+            # El disco no da abasto: se salta esta captura (la secuencia sigue numerada sin huecos)
+            burst["dropped"] += 1
+        if burst["taken"] + burst["dropped"] >= SNAPSHOT_CONFIG["burst_frames"]:
+            self.stop_burst()
+        else:
+            self.burst_timer = self.root.after(SNAPSHOT_CONFIG["burst_interval_ms"],
+                                               self.capture_burst_frame)
+    
+    def stop_burst(self):
+        """Detener la ráfaga en curso (las capturas ya encoladas se guardan igual)"""
+        if self.burst_timer:
+            self.root.after_cancel(self.burst_timer)
+            self.burst_timer = None
+        self.burst_var.set(False)
+        if not self.burst or not self.burst["active"]:
+            return
+        self.burst["active"] = False
+        if self.burst["dropped"]:
+            self.info_panel.show_notice(
+                f"🎞️ Ráfaga detenida: {self.burst['dropped']} capturas omitidas por la cola llena"
+            )
     
     def toggle_fullscreen(self, event=None):
         """Alternar pantalla completa"""
         self.fullscreen = not self.root.attributes('-fullscreen')
         self.root.attributes('-fullscreen', self.fullscreen)
     
-    def return_to_welcome(self):
-        """Volver a la pantalla de bienvenida"""
-        # Detener animación y consejos
+    def show(self):
+        """Volver a mostrar el laboratorio tal como se dejó"""
+        self.setup_window()
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.resume_background_tasks()
+    
+    def hide(self):
+        """Ocultar el laboratorio sin destruirlo (queda en pausa)"""
+        self.pause_background_tasks()
+        self.frame.pack_forget()
+    
+    def pause_background_tasks(self):
+        """Pausar la animación y los temporizadores (el hilo de resolución sigue vivo)
+
+        Las resoluciones y la curva de resonancia pendientes no se lanzan
+        contra el laboratorio oculto: resume_background_tasks las vuelve a pedir.
+        """
+        self.update_on_resume = bool(self.solve_debounce or self.resonance_debounce)
+        if self.animation_manager:
+            self.animation_manager.pause_animation()
+        self.stop_burst()
+        for scheduled in (self.tip_scheduler, self.solve_poller, self.playback_reporter,
+                          self.solve_debounce, self.resonance_debounce):
+            if scheduled:
+                self.root.after_cancel(scheduled)
+        self.tip_scheduler = self.solve_poller = self.playback_reporter = None
+        self.solve_debounce = self.resonance_debounce = None
+    
+    def resume_background_tasks(self):
+        """Retomar lo pausado por pause_background_tasks"""
+        self.animation_manager.resume_animation()
+        self.poll_solutions()
+        self.report_playback()
+        self.tip_scheduler = self.root.after(5000, self.schedule_tips)
+        if self.update_on_resume:
+            self.update_on_resume = False
+            self.update_simulation()
+    
+    def stop_background_tasks(self):
+        """Detener animación, hilo de resolución y temporizadores"""
+        self.pause_background_tasks()
         if self.animation_manager:
             self.animation_manager.stop_animation()
-        if self.tip_scheduler:
-            self.root.after_cancel(self.tip_scheduler)
+        if self.snapshot_poller:
+            self.root.after_cancel(self.snapshot_poller)
+        self.solve_worker.close()
+        self.resonance_worker.close()
+        # Esperar a que se guarden las capturas ya tomadas
+        self.snapshot_worker.close()
         
-        # Cerrar ventana actual
-        self.root.destroy()
-        
-        # Crear nueva ventana de bienvenida
-        from .welcome_screen import WelcomeScreen
-        welcome_root = tk.Tk()
-        welcome_app = WelcomeScreen(welcome_root)
-        welcome_root.mainloop()
+        # Guardar las mediciones de rendimiento si se pidió
+        if PERF_CONFIG["dump_path"] and (monitor.samples or monitor.counters):
+            try:
+                monitor.dump(PERF_CONFIG["dump_path"])
+            except OSError as e:
+                print(f"No se pudieron guardar las mediciones: {e}")
+    
+    def return_to_welcome(self):
+        """Volver a la pantalla de bienvenida (en la misma ventana)"""
+        # Pausar animación y consejos; el laboratorio se reutiliza en la próxima visita
+        self.hide()
+        if self.on_home:
+            self.on_home()
     
     def quit_application(self):
         """Salir de la aplicación"""
-        # Detener animación y consejos
-        if self.animation_manager:
-            self.animation_manager.stop_animation()
-        if self.tip_scheduler:
-            self.root.after_cancel(self.tip_scheduler)
+        # Detener animación, resoluciones y consejos
+        self.stop_background_tasks()
         
         # Cerrar aplicación
         self.root.quit()
@@ -0,0 +1,111 @@
+"""
+Instrumentación de los caminos críticos (latencias y contadores)
+"""
+
+import functools
+import json
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# Percentiles reportados
+PERCENTILES = (50, 95, 99)
+
+
+class PerfMonitor:
+    """Registro de tiempos por métrica con histogramas de ventana deslizante
+
+    Desactivado no guarda nada: los puntos instrumentados solo consultan
+    'enabled'. Se puede activar y desactivar en tiempo de ejecución. record()
+    es seguro entre hilos (la resolución se mide en el hilo de trabajo).
+    """
+
+    def __init__(self, window=2048, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.samples = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled):
+        """Activar o desactivar la medición"""
+        self.enabled = enabled
+
+    def record(self, name, seconds):
+        """Registrar una duración (en segundos) para una métrica"""
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def count(self, name, amount=1):
+        """Sumar a un contador (p. ej. frames omitidos)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        """Borrar todas las mediciones"""
+        with self._lock:
+            self.samples.clear()
+            self.counters.clear()
+
+    def summary(self):
+        """Percentiles en ms y número de muestras por métrica, más los contadores"""
+        with self._lock:
+            samples = {name: np.array(values) for name, values in self.samples.items() if values}
+            counters = dict(self.counters)
+        metrics = {}
+        for name, values in samples.items():
+            p50, p95, p99 = np.percentile(values, PERCENTILES) * 1000
+            metrics[name] = {
+                "count": len(values), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99,
+                "max_ms": values.max() * 1000,
+            }
+        return {"metrics": metrics, "counters": counters}
+
+    def format_summary(self):
+        """Resumen legible en pocas líneas (para el panel de información)"""
+        summary = self.summary()
+        if not summary["metrics"] and not summary["counters"]:
+            return "Sin mediciones todavía"
+        lines = [
+            f"{name}: {stats['p50_ms']:.1f} / {stats['p95_ms']:.1f} / {stats['p99_ms']:.1f} ms"
+            for name, stats in sorted(summary["metrics"].items())
+        ]
+        lines += [f"{name}: {value}" for name, value in sorted(summary["counters"].items())]
+        return "p50 / p95 / p99\n" + "\n".join(lines)
+
+    def dump(self, path):
+        """Guardar el resumen en un archivo JSON"""
+        summary = self.summary()
+        summary["window"] = self.window
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return path
+
+
+# Monitor compartido por toda la aplicación
+monitor = PerfMonitor()
+
+
+def timed(name):
+    """Decorador que registra la duración de cada llamada en 'monitor'"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not monitor.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                monitor.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -2,17 +2,345 @@
 Motor físico para el sistema masa-resorte
 """
 
+import math
+
 import numpy as np
-from scipy.integrate import solve_ivp
+
+from .perf_monitor import timed
+
+# scipy se importa dentro de las funciones que lo usan: el método analítico
+# (el habitual) solo necesita numpy, y scipy.signal/integrate tardan cerca de
+# un segundo en importarse al arrancar
+
+# Métodos de resolución propios (además de los de solve_ivp)
+SOLVER_METHODS = ("auto", "analytic", "exact")
+
+# Métodos implícitos de solve_ivp que usan el jacobiano analítico
+IMPLICIT_METHODS = ("Radau", "BDF", "LSODA")
+
+# Tipos de fuerza con solución analítica exacta
+ANALYTIC_FORCE_TYPES = ("Coseno", "Seno", "Pulso", "Escalón")
+
+# Tipos de fuerza armónicos (los únicos con respuesta en frecuencia estacionaria)
+HARMONIC_FORCE_TYPES = ("Coseno", "Seno")
+
+# Instante en que se activa la fuerza escalón (s)
+STEP_TIME = 2.0
+
+# Tolerancia relativa para detectar amortiguamiento crítico y resonancia sin amortiguar
+_REGIME_TOL = 1e-9
+
+
+def _decay_basis(t, alpha, wn2):
+    """Funciones base e^(-αt)·cosh(st) y e^(-αt)·sinh(st)/s, con s² = α² - ωn²
+
+    Cubre los regímenes subamortiguado, crítico y sobreamortiguado. Los
+    parámetros pueden ser arreglos que se difunden contra t.
+    """
+    t, alpha, wn2 = np.broadcast_arrays(
+        np.asarray(t, dtype=float), np.asarray(alpha, dtype=float), np.asarray(wn2, dtype=float)
+    )
+    disc = alpha**2 - wn2
+    tol = _REGIME_TOL * wn2
+    under = disc < -tol
+    over = disc > tol
+    critical = ~(under | over)
+
+    basis_c = np.empty(t.shape)
+    basis_s = np.empty(t.shape)
+
+    # Subamortiguado: s = iωd
+    tu = t[under]
+    wd = np.sqrt(-disc[under])
+    decay = np.exp(-alpha[under] * tu)
+    basis_c[under] = decay * np.cos(wd * tu)
+    basis_s[under] = decay * np.sin(wd * tu) / wd
+
+    # Sobreamortiguado: exponenciales separadas para evitar desbordes de cosh/sinh
+    to = t[over]
+    ao = alpha[over]
+    s = np.sqrt(disc[over])
+    slow = np.exp((s - ao) * to)
+    fast = np.exp(-(s + ao) * to)
+    basis_c[over] = 0.5 * (slow + fast)
+    basis_s[over] = (slow - fast) / (2 * s)
+
+    # Crítico: s = 0
+    tc = t[critical]
+    decay = np.exp(-alpha[critical] * tc)
+    basis_c[critical] = decay
+    basis_s[critical] = decay * tc
+
+    return basis_c, basis_s
+
+
+def _free_response(t, y0, v0, mass, stiffness, damping):
+    """Respuesta libre (posición, velocidad) partiendo del estado (y0, v0) en t=0"""
+    alpha = damping / (2 * mass)
+    wn2 = stiffness / mass
+    basis_c, basis_s = _decay_basis(t, alpha, wn2)
+    y = y0 * basis_c + (v0 + alpha * y0) * basis_s
+    v = v0 * basis_c - (wn2 * y0 + alpha * v0) * basis_s
+    return y, v
+
+
+def _harmonic_particular(t, mass, stiffness, damping, force_amplitude, frequency, phasor):
+    """Solución particular (posición, velocidad) para F(t) = Re[F0·phasor·e^(iωt)]
+
+    phasor = 1 corresponde a coseno y phasor = -1j a seno. En resonancia sin
+    amortiguamiento se usa la solución secular, que crece linealmente con t.
+    """
+    t = np.asarray(t, dtype=float)
+    impedance = stiffness - mass * frequency**2 + 1j * damping * frequency
+    resonant = np.abs(impedance) <= _REGIME_TOL * stiffness
+    amplitude = force_amplitude * phasor
+
+    steady = np.where(resonant, 0.0, amplitude / np.where(resonant, 1.0, impedance))
+    secular = np.where(resonant, amplitude / (2j * mass * np.where(resonant, frequency, 1.0)), 0.0)
+
+    rotation = np.exp(1j * frequency * t)
+    y = ((steady + secular * t) * rotation).real
+    v = ((1j * frequency * steady + secular * (1 + 1j * frequency * t)) * rotation).real
+    return y, v
+
+
+def _pulse_response(t, t0, y0, v0, mass, stiffness, damping, force_amplitude, frequency):
+    """Solución exacta (posición, velocidad) para F(t) = F0·(0.5 + 0.5·sign(sin ωt))
+
+    La fuerza es constante a tramos: F0 en los semiperiodos pares
+    [jπ/ω, (j+1)π/ω) y 0 en los impares. En cada tramo la solución es la
+    respuesta libre alrededor del desplazamiento estático F/k, y el estado se
+    arrastra de un borde al siguiente (todas las filas a la vez). Las muestras
+    se evalúan luego en una sola pasada desde el inicio de su tramo.
+    """
+    t = np.asarray(t, dtype=float)
+    t0, y0, v0, mass, stiffness, damping, force_amplitude, frequency = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float)
+          for value in (t0, y0, v0, mass, stiffness, damping, force_amplitude, frequency))
+    )
+    with np.errstate(divide="ignore"):
+        half = np.where(frequency > 0, np.pi / np.where(frequency > 0, frequency, 1.0), np.inf)
+    first = np.floor(t0 / half)
+    segment = np.maximum(np.floor(t / half), first)
+    count = int((segment - first).max()) + 1 if segment.size else 1
+
+    def static(j):
+        # Con ω = 0, sign(sin 0) = 0 y la fuerza queda en F0/2
+        level = np.where(frequency > 0, force_amplitude * (j % 2 == 0), 0.5 * force_amplitude)
+        return level / stiffness
+
+    # Estado al inicio de cada tramo desde el de t0
+    starts_t, starts_y, starts_v = [t0], [y0], [v0]
+    if count > 1:
+        # Primer tramo (parcial, desde t0) con la respuesta libre completa
+        # (las filas con ω = 0 no tienen bordes: su estado no se usa más allá de t0)
+        edge = np.where(np.isfinite(half), (first + 1) * half, t0)
+        offset = static(first)
+        y, v = _free_response(edge - t0, y0 - offset, v0, mass, stiffness, damping)
+        starts_t.append(edge)
+        starts_y.append(y + offset)
+        starts_v.append(v)
+
+        # Los tramos completos duran siempre π/ω: la misma transición 2x2 para todos
+        alpha = damping / (2 * mass)
+        wn2 = stiffness / mass
+        basis_c, basis_s = _decay_basis(np.where(np.isfinite(half), half, 0.0), alpha, wn2)
+        p11, p12 = basis_c + alpha * basis_s, basis_s
+        p21, p22 = -wn2 * basis_s, basis_c - alpha * basis_s
+        for s in range(2, count):
+            offset = static(first + s - 1)
+            u, v = starts_y[-1] - offset, starts_v[-1]
+            starts_t.append((first + s) * half)
+            starts_y.append(offset + p11 * u + p12 * v)
+            starts_v.append(p21 * u + p22 * v)
+
+    index = (segment - first).astype(int)[..., None]
+
+    def gather(values):
+        stacked = np.stack(values, axis=-1)
+        return np.take_along_axis(
+            np.broadcast_to(stacked, index.shape[:-1] + (count,)), index, axis=-1
+        )[..., 0]
+
+    offset = static(first + index[..., 0])
+    y, v = _free_response(t - gather(starts_t), gather(starts_y) - offset, gather(starts_v),
+                          mass, stiffness, damping)
+    return y + offset, v
+
+
+def _analytic_response(t, t0, y0, v0, mass, stiffness, damping, force_amplitude, frequency, force_type):
+    """Solución exacta (posición, velocidad) desde el estado (y0, v0) en t0
+
+    Válida para los tipos de ANALYTIC_FORCE_TYPES y para todos los regímenes
+    de amortiguamiento. Todos los argumentos numéricos admiten difusión.
+    """
+    t = np.asarray(t, dtype=float)
+
+    if force_type == "Pulso":
+        return _pulse_response(t, t0, y0, v0, mass, stiffness, damping, force_amplitude, frequency)
+
+    if force_type == "Escalón":
+        static = force_amplitude / stiffness
+        if np.all(np.asarray(t0) >= STEP_TIME):
+            y, v = _free_response(t - t0, y0 - static, v0, mass, stiffness, damping)
+            return y + static, v
+
+        # Tramo libre hasta el escalón y tramo forzado a partir del estado en STEP_TIME
+        y_pre, v_pre = _free_response(t - t0, y0, v0, mass, stiffness, damping)
+        y_step, v_step = _free_response(STEP_TIME - t0, y0, v0, mass, stiffness, damping)
+        y_post, v_post = _free_response(
+            np.maximum(t - STEP_TIME, 0.0), y_step - static, v_step, mass, stiffness, damping
+        )
+        after = t > STEP_TIME
+        return np.where(after, y_post + static, y_pre), np.where(after, v_post, v_pre)
+
+    phasor = -1j if force_type == "Seno" else 1.0
+    y_p, v_p = _harmonic_particular(t, mass, stiffness, damping, force_amplitude, frequency, phasor)
+    y_p0, v_p0 = _harmonic_particular(t0, mass, stiffness, damping, force_amplitude, frequency, phasor)
+    y_h, v_h = _free_response(t - t0, y0 - y_p0, v0 - v_p0, mass, stiffness, damping)
+    return y_p + y_h, v_p + v_h
+
+
+def _zoh_matrices(mass, stiffness, damping, dt):
+    """Matriz de transición expm(A·dt) y término de entrada Γ con retención de orden cero"""
+    from scipy.linalg import expm
+
+    block = np.array([
+        [0.0, 1.0, 0.0],
+        [-stiffness / mass, -damping / mass, 1.0 / mass],
+        [0.0, 0.0, 0.0],
+    ]) * dt
+    transition = expm(block)
+    return transition[:2, :2], transition[:2, 2]
+
+
+def _exact_discrete_response(t_eval, y0, v0, mass, stiffness, damping, force_samples):
+    """Avanzar el estado sobre una malla uniforme con discretización exacta
+
+    force_samples[j] se mantiene constante en [t_j, t_j+1). La recurrencia
+    x_j+1 = Φ·x_j + Γ·F_j se aplica como un filtro IIR de segundo orden,
+    con costo constante por paso.
+    """
+    from scipy.signal import lfilter
+
+    t_eval = np.asarray(t_eval, dtype=float)
+    y, v = _free_response(t_eval - t_eval[0], y0, v0, mass, stiffness, damping)
+    if t_eval.size < 2:
+        return y, v
+
+    phi, gamma = _zoh_matrices(mass, stiffness, damping, t_eval[1] - t_eval[0])
+    den = [1.0, -np.trace(phi), np.linalg.det(phi)]
+    num_y = [0.0, gamma[0], phi[0, 1] * gamma[1] - phi[1, 1] * gamma[0]]
+    num_v = [0.0, gamma[1], phi[1, 0] * gamma[0] - phi[0, 0] * gamma[1]]
+    return y + lfilter(num_y, den, force_samples), v + lfilter(num_v, den, force_samples)
+
+
+def _midpoints(t_eval):
+    """Centros de los intervalos de una malla uniforme (mismo tamaño que la malla)"""
+    dt = t_eval[1] - t_eval[0] if len(t_eval) > 1 else 0.0
+    return t_eval + 0.5 * dt
+
+
+def _batch_force(t, force_amplitude, frequency, force_types):
+    """Fuerza externa de cada fila de un lote en el instante t"""
+    phase = frequency * t
+    force = np.where(force_types == "Seno", np.sin(phase), np.cos(phase))
+    force = np.where(force_types == "Pulso", 0.5 + 0.5 * np.sign(np.sin(phase)), force)
+    force = np.where(force_types == "Escalón", t > STEP_TIME, force)
+    return force_amplitude * force
+
+
+def compile_force(force_type, force_amplitude, frequency):
+    """Fuerza externa F(t) vectorizada con las constantes ya ligadas"""
+    F0, omega = force_amplitude, frequency
+    if force_type == "Seno":
+        return lambda t: F0 * np.sin(omega * t)
+    if force_type == "Pulso":
+        return lambda t: F0 * (0.5 + 0.5 * np.sign(np.sin(omega * t)))
+    if force_type == "Escalón":
+        return lambda t: F0 * (t > STEP_TIME)
+    return lambda t: F0 * np.cos(omega * t)
+
+
+def force_edges(force_type, frequency, t_start, t_end):
+    """Instantes en (t_start, t_end) donde salta una fuerza Pulso o Escalón"""
+    if force_type == "Escalón":
+        return np.array([STEP_TIME]) if t_start < STEP_TIME < t_end else np.empty(0)
+    if force_type == "Pulso" and frequency > 0:
+        half = np.pi / frequency
+        edges = np.arange(np.floor(t_start / half) + 1, np.ceil(t_end / half)) * half
+        return edges[(edges > t_start) & (edges < t_end)]
+    return np.empty(0)
+
+
+def _compile_rhs(mass, stiffness, damping, force_type, force_amplitude, frequency):
+    """Lado derecho especializado por tipo de fuerza, con las constantes ligadas
+
+    Sin búsquedas en diccionarios ni comparaciones de cadenas por evaluación.
+    solve_ivp pasa t escalar e Y como arreglo (2,): se opera con floats de
+    Python (Y.tolist() y math), mucho más rápidos que los escalares de numpy.
+    """
+    inv_mass = 1.0 / mass if mass else math.inf
+    a = -stiffness * inv_mass
+    b = -damping * inv_mass
+    f = force_amplitude * inv_mass
+    omega = frequency
+
+    if force_type == "Seno":
+        def rhs(t, Y):
+            y, v = Y.tolist()
+            return [v, a * y + b * v + f * math.sin(omega * t)]
+    elif force_type == "Pulso":
+        def rhs(t, Y):
+            y, v = Y.tolist()
+            s = math.sin(omega * t)
+            return [v, a * y + b * v + (f if s > 0 else 0.5 * f if s == 0 else 0.0)]
+    elif force_type == "Escalón":
+        def rhs(t, Y):
+            y, v = Y.tolist()
+            return [v, a * y + b * v + (f if t > STEP_TIME else 0.0)]
+    else:
+        def rhs(t, Y):
+            y, v = Y.tolist()
+            return [v, a * y + b * v + f * math.cos(omega * t)]
+    return rhs
+
+
+def _constant_force_rhs(mass, stiffness, damping, force):
+    """Lado derecho con fuerza constante (un tramo entre saltos de la fuerza)"""
+    inv_mass = 1.0 / mass if mass else math.inf
+    a, b, f = -stiffness * inv_mass, -damping * inv_mass, force * inv_mass
+
+    def rhs(t, Y):
+        y, v = Y.tolist()
+        return [v, a * y + b * v + f]
+    return rhs
+
+
+def _jacobian(mass, stiffness, damping):
+    """Jacobiano constante del sistema lineal [[0, 1], [-k/m, -c/m]]"""
+    inv_mass = 1.0 / mass if mass else math.inf
+    return np.array([[0.0, 1.0], [-stiffness * inv_mass, -damping * inv_mass]])
+
 
 class PhysicsEngine:
     """Motor de física para resolver el sistema masa-resorte"""
     
-    def __init__(self):
+    def __init__(self, method="auto", cache=None, atlas=None):
         self.parameters = {}
+        # "auto": analítico cuando sea posible, RK45 en otro caso
+        self.method = method
+        # Caché opcional de trayectorias (TrajectoryCache)
+        self.cache = cache
+        # Atlas precalculado opcional (TrajectoryAtlas)
+        self.atlas = atlas
         
     def set_parameters(self, mass, stiffness, damping, force_amplitude, frequency, force_type="Coseno"):
-        """Establecer parámetros del sistema"""
+        """Establecer parámetros del sistema
+
+        También compila la fuerza, el lado derecho y el jacobiano para estos
+        parámetros, de modo que cada evaluación no vuelva a consultarlos.
+        """
         self.parameters = {
             'mass': mass,
             'stiffness': stiffness,
@@ -21,55 +349,263 @@ class PhysicsEngine:
             'frequency': frequency,
             'force_type': force_type
         }
+        self.force = compile_force(force_type, force_amplitude, frequency)
+        self.rhs = _compile_rhs(mass, stiffness, damping, force_type, force_amplitude, frequency)
+        self.jacobian = _jacobian(mass, stiffness, damping)
     
     def external_force(self, t):
         """Calcular fuerza externa según el tipo"""
-        force_type_map = {
-            "Coseno": "cos",
-            "Seno": "sin",
-            "Pulso": "pulse",
-            "Escalón": "step",
-        }
-        
-        actual_type = force_type_map.get(self.parameters.get('force_type', 'Coseno'), "cos")
-        F0 = self.parameters['force_amplitude']
-        omega = self.parameters['frequency']
-
-        if actual_type == "cos":
-            return F0 * np.cos(omega * t)
-        elif actual_type == "sin":
-            return F0 * np.sin(omega * t)
-        elif actual_type == "pulse":
-            return F0 * (0.5 + 0.5 * np.sign(np.sin(omega * t)))
-        elif actual_type == "step":
-            return F0 * (t > 2.0)
-        return 0.0
+        return self.force(t)
 
     def equation(self, t, Y):
         """Ecuación diferencial del sistema"""
-        y, yp = Y
-        m = self.parameters['mass']
-        k = self.parameters['stiffness']
-        c = self.parameters['damping']
-        
-        force = self.external_force(t)
-        dydt = yp
-        dypdt = (-k * y - c * yp + force) / m
-        
-        return [dydt, dypdt]
+        return self.rhs(t, Y)
+
+    def _ivp_options(self, method):
+        """Opciones de solve_ivp: jacobiano analítico para los métodos implícitos"""
+        if method not in IMPLICIT_METHODS:
+            return {}
+        jacobian = self.jacobian
+        return {"jac": lambda t, Y: jacobian}
+
+    def has_analytic_solution(self):
+        """Verificar si el tipo de fuerza actual admite solución analítica"""
+        return (self.parameters.get('force_type', 'Coseno') in ANALYTIC_FORCE_TYPES
+                and self.parameters['mass'] > 0 and self.parameters['stiffness'] > 0)
+
+    def analytic_response(self, t_eval):
+        """Evaluar la solución exacta desde el reposo sobre t_eval (posición, velocidad)"""
+        p = self.parameters
+        return _analytic_response(
+            t_eval, 0.0, 0.0, 0.0,
+            p['mass'], p['stiffness'], p['damping'],
+            p['force_amplitude'], p['frequency'], p.get('force_type', 'Coseno')
+        )
+
+    @timed("solve")
+    def solve_system(self, t_max=17, num_points=800, method=None):  # Cambiar default a 20
+        """Resolver el sistema de ecuaciones diferenciales
+
+        method: "auto" (analítico si el tipo de fuerza lo permite, RK45 si no),
+        "analytic", "exact" (discretización exacta de paso fijo, con la fuerza
+        muestreada en el centro de cada intervalo) o cualquier método de
+        solve_ivp (con Pulso y Escalón se integra por tramos entre los saltos
+        de la fuerza). Por defecto usa self.method. Si el motor tiene atlas o caché,
+        las trayectorias ya resueltas se devuelven sin recalcular.
+        """
+        method = method or self.method
+        if self.atlas is not None:
+            found = self.atlas.lookup(self.parameters, t_max, num_points, method)
+            if found is not None:
+                return found
+        if self.cache is None:
+            return self._solve(t_max, num_points, method)
 
-    def solve_system(self, t_max=17, num_points=800):  # Cambiar default a 20
-        """Resolver el sistema de ecuaciones diferenciales"""
+        key = self.cache.make_key(self.parameters, t_max, num_points, method)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        t, y = self._solve(t_max, num_points, method)
+        self.cache.put(key, t, y)
+        return t, y
+
+    def _solve(self, t_max, num_points, method):
+        """Resolver el sistema sin pasar por la caché"""
         t_eval = np.linspace(0, t_max, num_points)
+        y, _ = self._advance(t_eval, (0.0, 0.0), method)
+        return t_eval, y
+
+    def _advance(self, t_eval, state, method):
+        """Resolver desde el estado (y, v) en t_eval[0]; devuelve (posición, velocidad)"""
+        p = self.parameters
+        y0, v0 = state
+
+        if method == "analytic" and not self.has_analytic_solution():
+            raise ValueError(f"Sin solución analítica para la fuerza '{p.get('force_type')}'")
+        if method == "analytic" or (method == "auto" and self.has_analytic_solution()):
+            return _analytic_response(
+                t_eval, t_eval[0], y0, v0,
+                p['mass'], p['stiffness'], p['damping'],
+                p['force_amplitude'], p['frequency'], p.get('force_type', 'Coseno')
+            )
+        if method == "exact":
+            force = self.external_force(_midpoints(t_eval))
+            return _exact_discrete_response(
+                t_eval, y0, v0, p['mass'], p['stiffness'], p['damping'], force
+            )
+
+        method = "RK45" if method == "auto" else method
+        edges = self.force_edges(t_eval[0], t_eval[-1])
+        if edges.size:
+            return self._advance_segments(t_eval, state, method, edges)
+
+        from scipy.integrate import solve_ivp
         sol = solve_ivp(
-            self.equation, 
-            [0, t_max], 
-            [0, 0], 
+            self.rhs, 
+            [t_eval[0], t_eval[-1]], 
+            [y0, v0], 
             t_eval=t_eval, 
-            method="RK45"
+            method=method,
+            **self._ivp_options(method)
         )
-        return sol.t, sol.y[0]
+        return sol.y[0], sol.y[1]
+
+    def force_edges(self, t_start, t_end):
+        """Instantes en (t_start, t_end) donde la fuerza externa salta (Pulso, Escalón)"""
+        p = self.parameters
+        return force_edges(p.get('force_type', 'Coseno'), p['frequency'], t_start, t_end)
+
+    def _advance_segments(self, t_eval, state, method, edges):
+        """Integrar con solve_ivp tramo a tramo entre saltos de la fuerza
+
+        Dentro de cada tramo la fuerza es constante, así que el integrador no
+        tiene que rechazar pasos cerca de las discontinuidades; el estado final
+        de cada tramo es el inicial del siguiente.
+        """
+        from scipy.integrate import solve_ivp
+
+        p = self.parameters
+        m, k, c = p['mass'], p['stiffness'], p['damping']
+        bounds = np.concatenate(([t_eval[0]], edges, [t_eval[-1]]))
+        y = np.empty(len(t_eval))
+        v = np.empty(len(t_eval))
+        for a, b in zip(bounds[:-1], bounds[1:]):
+            force = self.external_force(0.5 * (a + b))
+            sol = solve_ivp(
+                _constant_force_rhs(m, k, c, force),
+                [a, b], state, method=method, dense_output=True,
+                **self._ivp_options(method)
+            )
+            inside = (t_eval >= a) & ((t_eval < b) | (b == t_eval[-1]))
+            y[inside], v[inside] = sol.sol(t_eval[inside])
+            state = sol.y[:, -1]
+        return y, v
+
+    def stream(self, dt, chunk_size=40, method=None):
+        """Generador sin fin de fragmentos (t, y) de la trayectoria desde el reposo
+
+        Cada fragmento tiene chunk_size muestras separadas dt y continúa desde
+        el estado (posición, velocidad) final del anterior, así que el horizonte
+        no tiene límite y la memoria es constante. Los parámetros se leen en
+        cada fragmento: un cambio se aplica sin reiniciar el movimiento.
+        """
+        state = (0.0, 0.0)
+        start = 0
+        offsets = np.arange(chunk_size + 1)
+        while True:
+            # Tiempos como índice entero por dt: sin deriva acumulada
+            t_eval = (start + offsets) * dt
+            y, v = self._advance(t_eval, state, method or self.method)
+            state = (y[-1], v[-1])
+            start += chunk_size
+            yield t_eval[:-1], y[:-1]
     
+    def solve_batch(self, mass, stiffness, damping, force_amplitude, frequency,
+                    force_type="Coseno", t_max=17, num_points=800, method=None):
+        """Resolver un lote de N sistemas independientes en una sola llamada
+
+        Los parámetros son escalares o arreglos de longitud N (se difunden entre
+        sí). Las filas con solución analítica se evalúan en bloque; el resto se
+        integra a la vez como un único estado vectorizado de forma (2, N).
+        Devuelve (t, Y) con Y de forma (N, num_points).
+        """
+        method = method or self.method
+        t_eval = np.linspace(0, t_max, num_points)
+        mass, stiffness, damping, force_amplitude, frequency, force_types = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(mass, dtype=float)),
+            np.asarray(stiffness, dtype=float),
+            np.asarray(damping, dtype=float),
+            np.asarray(force_amplitude, dtype=float),
+            np.asarray(frequency, dtype=float),
+            np.asarray(force_type, dtype=object),
+        )
+        displacement = np.empty((mass.size, num_points))
+
+        pending = np.ones(mass.size, dtype=bool)
+        if method in ("auto", "analytic"):
+            for analytic_type in ANALYTIC_FORCE_TYPES:
+                rows = (force_types == analytic_type) & (mass > 0) & (stiffness > 0)
+                if not rows.any():
+                    continue
+                displacement[rows], _ = _analytic_response(
+                    t_eval, 0.0, 0.0, 0.0,
+                    mass[rows, None], stiffness[rows, None], damping[rows, None],
+                    force_amplitude[rows, None], frequency[rows, None], analytic_type
+                )
+                pending &= ~rows
+            if method == "analytic" and pending.any():
+                raise ValueError("Sin solución analítica para algunas filas del lote")
+
+        if method == "exact":
+            t_mid = _midpoints(t_eval)
+            for row in np.flatnonzero(pending):
+                force = _batch_force(t_mid, force_amplitude[row], frequency[row], force_types[row])
+                displacement[row], _ = _exact_discrete_response(
+                    t_eval, 0.0, 0.0, mass[row], stiffness[row], damping[row], force
+                )
+            pending[:] = False
+
+        if pending.any():
+            from scipy.integrate import solve_ivp
+
+            m, k, c = mass[pending], stiffness[pending], damping[pending]
+            F0, omega, types = force_amplitude[pending], frequency[pending], force_types[pending]
+            n = m.size
+
+            def batch_equation(t, Y):
+                y, yp = Y.reshape(2, n)
+                force = _batch_force(t, F0, omega, types)
+                return np.concatenate((yp, (-k * y - c * yp + force) / m))
+
+            sol = solve_ivp(
+                batch_equation,
+                [0, t_max],
+                np.zeros(2 * n),
+                t_eval=t_eval,
+                method="RK45" if method == "auto" else method
+            )
+            displacement[pending] = sol.y[:n]
+
+        return t_eval, displacement
+
+    def frequency_response(self, frequencies):
+        """Amplitud y fase estacionarias para muchas frecuencias en una sola pasada
+
+        Evalúa la función de transferencia H(iω) = 1 / (k - m·ω² + i·c·ω)
+        escalada por F0. La fase (rad) es el atraso del desplazamiento
+        respecto de la fuerza. Sin amortiguamiento, en ω = ωn la amplitud es inf.
+        """
+        p = self.parameters
+        omega = np.asarray(frequencies, dtype=float)
+        impedance = p['stiffness'] - p['mass'] * omega**2 + 1j * p['damping'] * omega
+        with np.errstate(divide="ignore", invalid="ignore"):
+            response = p['force_amplitude'] / impedance
+        return np.abs(response), np.angle(response)
+
+    def transient_peak(self, frequencies, t_max=17, num_points=800, method=None, chunk_size=256):
+        """Máximo de |y(t)| en [0, t_max] partiendo del reposo, para cada frecuencia
+
+        Incluye el transitorio (lo que se ve en la animación), no solo el
+        régimen estacionario. Resuelve las frecuencias por lotes con
+        solve_batch; sin método explícito usa la solución analítica cuando
+        existe y la discretización exacta en otro caso.
+        """
+        p = self.parameters
+        force_type = p.get('force_type', 'Coseno')
+        if method is None:
+            method = "auto" if force_type in ANALYTIC_FORCE_TYPES else "exact"
+        frequencies = np.asarray(frequencies, dtype=float)
+        peaks = np.empty(frequencies.shape)
+        flat = peaks.reshape(-1)
+        for start in range(0, flat.size, chunk_size):
+            chunk = frequencies.reshape(-1)[start:start + chunk_size]
+            _, displacement = self.solve_batch(
+                p['mass'], p['stiffness'], p['damping'], p['force_amplitude'], chunk,
+                force_type, t_max=t_max, num_points=num_points, method=method
+            )
+            flat[start:start + chunk.size] = np.abs(displacement).max(axis=1)
+        return peaks
+
     def calculate_natural_frequency(self):
         """Calcular frecuencia natural del sistema"""
         m = self.parameters['mass']
@@ -0,0 +1,181 @@
+"""
+Reloj único de renderizado para todos los canvas
+"""
+
+import time
+
+from .perf_monitor import monitor
+
+# Holgura del periodo de frame sobre el costo medido de un tick
+DRAW_HEADROOM = 1.25
+# Peso de cada medición nueva en los promedios exponenciales
+SMOOTHING = 0.1
+
+
+class PlaybackClock:
+    """Reloj de pared que mapea el tiempo real al tiempo simulado
+
+    Lleva la cuenta de los frames mostrados y de las muestras saltadas para
+    mantener la reproducción a velocidad real.
+    """
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self.restart()
+
+    def restart(self):
+        """Poner a cero el tiempo simulado y los contadores"""
+        self.origin = time.perf_counter()
+        self.paused_at = None
+        self.shown = 0
+        self.dropped = 0
+
+    def pause(self):
+        """Congelar el tiempo simulado (p. ej. con la pantalla oculta)"""
+        if self.paused_at is None:
+            self.paused_at = time.perf_counter()
+
+    def resume(self):
+        """Seguir desde el instante en que se pausó, sin contar la pausa como frames omitidos"""
+        if self.paused_at is not None:
+            self.origin += time.perf_counter() - self.paused_at
+            self.paused_at = None
+
+    def elapsed(self):
+        """Segundos simulados transcurridos desde restart() (sin contar las pausas)"""
+        now = self.paused_at if self.paused_at is not None else time.perf_counter()
+        return (now - self.origin) * self.speed
+
+    def record(self, advanced):
+        """Registrar un frame mostrado que avanzó 'advanced' muestras"""
+        self.shown += 1
+        self.dropped += max(0, advanced - 1)
+        if advanced > 1:
+            monitor.count("dropped_frames", advanced - 1)
+
+
+class RenderScheduler:
+    """Un solo temporizador que avanza la simulación y actualiza todos los canvas
+
+    Cada canvas se registra con su BlitManager y lleva un indicador de
+    "sucio": en cada tick solo se actualizan los marcados. El temporizador se
+    crea una vez y se reutiliza durante toda la sesión, de modo que nunca hay
+    más de uno activo ni quedan temporizadores viejos vivos.
+    """
+
+    def __init__(self, timer_canvas, interval=25, max_interval=100):
+        self.timer = timer_canvas.new_timer(interval=interval)
+        self.timer.add_callback(self.tick)
+        self.running = False
+        # Ajuste del ritmo al costo medido del dibujo
+        self.adaptive = False
+        self.target_interval = interval
+        self.max_interval = max_interval
+        self.tick_cost = None
+        self.tick_period = None
+        self.last_tick = None
+        self.last_tick_end = None
+        self.targets = {}
+        self.dirty = set()
+        # Paso de simulación por tick: callable() -> False cuando ya no hay frames
+        self.step = None
+
+    def add_canvas(self, name, blit_manager):
+        """Registrar un canvas (por su BlitManager) bajo un nombre"""
+        self.targets[name] = blit_manager
+        self.dirty.add(name)
+
+    def mark_dirty(self, *names):
+        """Marcar canvas para actualizar en el próximo tick (todos si no se indican)"""
+        self.dirty.update(names or self.targets)
+
+    def invalidate(self, *names):
+        """Forzar un redibujo completo (fondo incluido) en el próximo tick"""
+        for name in names or self.targets:
+            self.targets[name].invalidate()
+        self.mark_dirty(*names)
+        if not self.running:
+            self.flush()
+
+    def start(self, step, interval=None, adaptive=False):
+        """Empezar a avanzar 'step' en cada tick (reutiliza el temporizador)
+
+        Con adaptive=True el intervalo se ajusta al costo medido de cada tick.
+        """
+        self.step = step
+        self.adaptive = adaptive
+        if interval is not None:
+            self.target_interval = interval
+        if self.timer.interval != self.target_interval:
+            self.timer.interval = self.target_interval
+        if not self.running:
+            self.last_tick = None
+            self.last_tick_end = None
+            self.running = True
+            self.timer.start()
+
+    def stop(self):
+        """Detener el reloj"""
+        if self.running:
+            self.timer.stop()
+            self.running = False
+
+    def tick(self):
+        """Avanzar un paso y actualizar los canvas sucios en el mismo tick"""
+        started = time.perf_counter()
+        if self.last_tick is not None:
+            self.tick_period = self._smooth(self.tick_period, started - self.last_tick)
+        if monitor.enabled and self.last_tick_end is not None:
+            # Retraso del bucle de Tk: espera real menos la programada
+            monitor.record("tk_delay", started - self.last_tick_end - self.timer.interval / 1000)
+        self.last_tick = started
+
+        if self.step is not None and self.step() is False:
+            self.stop()
+        self.flush()
+
+        self.last_tick_end = time.perf_counter()
+        cost = self.last_tick_end - started
+        self.tick_cost = self._smooth(self.tick_cost, cost)
+        monitor.record("frame", cost)
+        if self.adaptive and self.running:
+            self.adapt_interval()
+
+    def adapt_interval(self):
+        """Ajustar la espera entre ticks al costo medido del dibujo
+
+        El temporizador de Tk programa el siguiente tick 'interval' ms después
+        de terminar el actual, así que el periodo real es costo + espera. Si
+        dibujar cuesta más que el intervalo objetivo, se baja la tasa de
+        frames en lugar de encadenar ticks sin dar respiro a la interfaz.
+        """
+        cost_ms = self.tick_cost * 1000
+        period = min(max(self.target_interval, cost_ms * DRAW_HEADROOM), self.max_interval)
+        interval = max(1, int(round(period - cost_ms)))
+        if interval != self.timer.interval:
+            self.timer.interval = interval
+
+    def stats(self):
+        """Tasa de frames y costo medio por tick medidos"""
+        return {
+            "fps": 1 / self.tick_period if self.tick_period else 0.0,
+            "tick_ms": 1000 * self.tick_cost if self.tick_cost is not None else 0.0,
+            "interval": self.timer.interval,
+        }
+
+    @staticmethod
+    def _smooth(average, sample):
+        """Promedio exponencial (el primer valor se toma tal cual)"""
+        return sample if average is None else average + SMOOTHING * (sample - average)
+
+    def flush(self):
+        """Actualizar ahora los canvas marcados como sucios"""
+        for name in self.targets:
+            if name in self.dirty:
+                if monitor.enabled:
+                    start = time.perf_counter()
+                    self.targets[name].update()
+                    monitor.record(f"draw_{name}", time.perf_counter() - start)
+                else:
+                    self.targets[name].update()
+        self.dirty.clear()
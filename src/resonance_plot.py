@@ -0,0 +1,124 @@
+"""
+Curva de resonancia (respuesta en frecuencia) en vivo
+"""
+
+import numpy as np
+
+from .physics_engine import HARMONIC_FORCE_TYPES
+
+
+class ResonanceCurve:
+    """Gráfico de amplitud vs frecuencia de la fuerza para los m, k, c actuales
+
+    Muestra la amplitud estacionaria (función de transferencia, muchas
+    frecuencias a la vez) y el pico real en el horizonte de la simulación,
+    que incluye el transitorio. La curva estacionaria solo tiene sentido con
+    fuerzas armónicas: con Pulso y Escalón se oculta y queda solo el pico.
+    Los picos se calculan fuera del hilo de Tk (solve_peaks, desde un
+    SolveWorker) y llegan con set_peaks. Las curvas solo se recalculan
+    cuando cambian los parámetros que las definen; mover la frecuencia solo
+    mueve el marcador.
+    """
+
+    def __init__(self, fig, ax, frequency_range, steady_points=2000, peak_points=200):
+        self.fig = fig
+        self.ax = ax
+        self.steady_frequencies = np.linspace(*frequency_range, steady_points)
+        self.peak_frequencies = np.linspace(*frequency_range, peak_points)
+        self.curve_key = None
+        self.steady = None
+        self.peaks = None
+        self.setup_plot()
+
+    def setup_plot(self):
+        """Configurar ejes, curvas y marcadores"""
+        self.ax.clear()
+        self.ax.set_xlim(self.steady_frequencies[0], self.steady_frequencies[-1])
+        self.ax.set_facecolor("#0F3460")
+        self.ax.set_xlabel("Frecuencia ω (rad/s)", color="white", fontsize=9)
+        self.ax.set_ylabel("Amplitud (m)", color="white", fontsize=9)
+        self.ax.grid(True, alpha=0.3, color="#FFD166")
+        self.ax.tick_params(colors="white", labelsize=8)
+        self.fig.subplots_adjust(left=0.15, bottom=0.17)
+
+        self.steady_line, = self.ax.plot([], [], "#FFD166", linewidth=2, label="Estacionaria")
+        self.peak_line, = self.ax.plot([], [], "#FF2E63", linewidth=1.5, linestyle="--",
+                                       label="Pico con transitorio")
+        self.natural_line = self.ax.axvline(x=0, color="#64FFDA", linestyle=":", alpha=0.8)
+        self.drive_line = self.ax.axvline(x=0, color="#00D4FF", linewidth=1.5, alpha=0.9)
+        self.drive_point, = self.ax.plot([], [], "o", color="#00D4FF", markersize=6)
+        self.update_legend()
+
+        for spine in self.ax.spines.values():
+            spine.set_color("#FFD166")
+
+    def update_legend(self):
+        """Leyenda con las curvas visibles"""
+        handles = [line for line in (self.steady_line, self.peak_line) if line.get_visible()]
+        legend = self.ax.legend(handles=handles, loc="upper right", fontsize=7,
+                                facecolor="#16213E", edgecolor="#FFD166")
+        for text in legend.get_texts():
+            text.set_color("white")
+
+    def update(self, physics_engine, t_max, num_points):
+        """Actualizar la curva para los parámetros actuales del motor
+
+        Devuelve True si cambiaron los parámetros que definen los picos: el
+        llamador debe pedirlos (solve_peaks) y entregarlos con set_peaks.
+        """
+        p = physics_engine.parameters
+        force_type = p.get('force_type', 'Coseno')
+        harmonic = force_type in HARMONIC_FORCE_TYPES
+        key = (p['mass'], p['stiffness'], p['damping'], p['force_amplitude'],
+               force_type, t_max, num_points)
+        changed = key != self.curve_key
+        if changed:
+            self.curve_key = key
+            self.steady = None
+            if harmonic:
+                self.steady, _ = physics_engine.frequency_response(self.steady_frequencies)
+                self.steady_line.set_data(self.steady_frequencies, self.steady)
+            if harmonic != self.steady_line.get_visible():
+                self.steady_line.set_visible(harmonic)
+                self.drive_point.set_visible(harmonic)
+                self.update_legend()
+            self.natural_line.set_xdata([physics_engine.calculate_natural_frequency()] * 2)
+            self.rescale()
+
+        frequency = p['frequency']
+        self.drive_line.set_xdata([frequency, frequency])
+        if harmonic:
+            amplitude, _ = physics_engine.frequency_response(frequency)
+            self.drive_point.set_data(
+                [frequency], [min(float(amplitude), self.ax.get_ylim()[1])]
+            )
+        self.fig.canvas.draw_idle()
+        return changed
+
+    def solve_peaks(self, engine, chain_engine, parameters, t_max, num_points, precompute):
+        """Tarea para SolveWorker: picos con transitorio (corre en el hilo de trabajo)
+
+        Devuelve (frecuencias, picos, None) en el lugar de (t, y, geometría).
+        """
+        engine.set_parameters(**parameters)
+        return self.peak_frequencies, engine.transient_peak(
+            self.peak_frequencies, t_max, num_points
+        ), None
+
+    def set_peaks(self, peaks):
+        """Mostrar los picos calculados por solve_peaks"""
+        self.peaks = peaks
+        self.peak_line.set_data(self.peak_frequencies, peaks)
+        self.rescale()
+        self.fig.canvas.draw_idle()
+
+    def rescale(self):
+        """Ajustar el eje vertical a los picos y a la curva estacionaria visibles"""
+        peak_top = self.peaks.max() if self.peaks is not None else 0
+        top = peak_top
+        if self.steady is not None:
+            # Sin amortiguamiento la curva estacionaria diverge: acotar con los picos reales
+            finite = self.steady[np.isfinite(self.steady)]
+            steady_top = finite.max() if finite.size else 0
+            top = max(peak_top, min(steady_top, 2 * peak_top)) if peak_top > 0 else steady_top
+        self.ax.set_ylim(0, 1.1 * top if top > 0 else 1)
@@ -0,0 +1,218 @@
+"""
+Trayectorias en memoria compartida entre un proceso de resolución y la interfaz
+
+El proceso de resolución copia (t, y, geometría) en uno de dos búferes de
+multiprocessing.shared_memory y lo publica; el proceso de Tk toma vistas
+numpy directamente sobre ese búfer, sin serializar ni copiar la trayectoria.
+
+Un encabezado compartido de enteros lleva el búfer publicado, el que tiene
+tomado la interfaz y un número de secuencia por búfer. El escritor siempre
+escribe en el búfer que la interfaz no tiene tomado y marca "escribiendo"
+mientras copia, así que la interfaz nunca ve un búfer a medio escribir. El
+encabezado solo se toca con el candado tomado (unas pocas asignaciones);
+la copia de los datos se hace fuera de él.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+SLOTS = 2
+
+# Campos globales del encabezado
+PUBLISHED, PUBLISHED_SEQ, HELD, COUNTER = range(4)
+GLOBAL_FIELDS = 4
+
+# Campos de cada búfer
+WRITING, SEQ, REQUEST_ID, GENERATION, FRAMES, COLUMNS, POINTS = range(7)
+SLOT_FIELDS = 7
+
+HEADER_SIZE = GLOBAL_FIELDS + SLOTS * SLOT_FIELDS
+
+# Margen al agrandar un búfer (evita recrearlo con cada cambio pequeño de tamaño)
+GROWTH = 1.5
+
+
+def slot_base(slot):
+    """Índice del primer campo de un búfer en el encabezado"""
+    return GLOBAL_FIELDS + slot * SLOT_FIELDS
+
+
+def segment_name(header_name, slot, generation):
+    """Nombre del segmento de un búfer (cambia cada vez que el búfer se agranda)"""
+    return f"{header_name}_{slot}_{generation}"
+
+
+def slot_layout(frames, columns, points):
+    """Desplazamientos en bytes de y y de la geometría dentro de un búfer, y su tamaño total
+
+    t ocupa frames float64; y, frames·max(columns, 1) float64 (columns = 0 es
+    una sola masa); la geometría, frames·points·2 float32.
+    """
+    y_offset = 8 * frames
+    geometry_offset = y_offset + 8 * frames * max(columns, 1)
+    return y_offset, geometry_offset, geometry_offset + 8 * frames * points
+
+
+def slot_views(buffer, frames, columns, points):
+    """Vistas numpy (t, y, geometría o None) sobre el contenido de un búfer"""
+    y_offset, geometry_offset, _ = slot_layout(frames, columns, points)
+    t = np.ndarray((frames,), dtype=np.float64, buffer=buffer)
+    y = np.ndarray((frames, columns) if columns else (frames,), dtype=np.float64,
+                   buffer=buffer, offset=y_offset)
+    geometry = None
+    if points:
+        geometry = np.ndarray((frames, points, 2), dtype=np.float32,
+                              buffer=buffer, offset=geometry_offset)
+    return t, y, geometry
+
+
+class TrajectoryChannel:
+    """Lado de la interfaz: crea el encabezado y lee las trayectorias publicadas
+
+    Las vistas devueltas por acquire() siguen siendo válidas hasta que
+    acquire() devuelva la siguiente trayectoria: mientras tanto el escritor
+    solo usa el otro búfer.
+    """
+
+    def __init__(self, context=None):
+        context = context or multiprocessing.get_context()
+        self.lock = context.Lock()
+        self._header_segment = shared_memory.SharedMemory(create=True, size=8 * HEADER_SIZE)
+        self.name = self._header_segment.name
+        self.header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=self._header_segment.buf)
+        self.header[:] = 0
+        self.header[[PUBLISHED, HELD]] = -1
+        self.seq = 0
+        # Segmentos abiertos por búfer: (generación, SharedMemory)
+        self._segments = [None] * SLOTS
+        self._retired = []
+
+    def writer_args(self):
+        """Argumentos para crear el TrajectoryWriter en el proceso de resolución"""
+        return self.name, self.lock
+
+    def acquire(self, request_id=None):
+        """Tomar la trayectoria publicada si es nueva: (request_id, t, y, geometría) o None
+
+        Con request_id solo se toma si corresponde a esa petición: las
+        obsoletas se ignoran sin soltar el búfer que la interfaz está usando.
+        """
+        header = self.header
+        with self.lock:
+            slot = int(header[PUBLISHED])
+            if slot < 0 or header[PUBLISHED_SEQ] == self.seq:
+                return None
+            fields = header[slot_base(slot):slot_base(slot) + SLOT_FIELDS].tolist()
+            if fields[WRITING] or (request_id is not None and fields[REQUEST_ID] != request_id):
+                return None
+            header[HELD] = slot
+            self.seq = int(header[PUBLISHED_SEQ])
+        segment = self._attach(slot, fields[GENERATION])
+        t, y, geometry = slot_views(segment.buf, fields[FRAMES], fields[COLUMNS], fields[POINTS])
+        return fields[REQUEST_ID], t, y, geometry
+
+    def _attach(self, slot, generation):
+        """Segmento actual de un búfer, abriéndolo de nuevo si el escritor lo agrandó"""
+        attached = self._segments[slot]
+        if attached is None or attached[0] != generation:
+            if attached is not None:
+                self._retired.append(attached[1])
+            segment = shared_memory.SharedMemory(name=segment_name(self.name, slot, generation))
+            self._segments[slot] = attached = (generation, segment)
+            self._close_retired()
+        return attached[1]
+
+    def _close_retired(self):
+        """Cerrar los segmentos reemplazados cuyas vistas ya nadie usa"""
+        in_use = []
+        for segment in self._retired:
+            try:
+                segment.close()
+            except BufferError:
+                in_use.append(segment)
+        self._retired = in_use
+
+    def close(self):
+        """Cerrar los segmentos abiertos y eliminar el encabezado"""
+        self._retired.extend(attached[1] for attached in self._segments if attached)
+        self._segments = [None] * SLOTS
+        self._close_retired()
+        self.header = None
+        self._header_segment.close()
+        self._header_segment.unlink()
+
+
+class TrajectoryWriter:
+    """Lado del proceso de resolución: copia cada trayectoria en el búfer libre y la publica
+
+    Los búferes se crean a demanda y se agrandan (con una nueva generación y
+    un nuevo nombre) cuando una trayectoria no cabe; el segmento viejo se
+    elimina, pero la interfaz puede seguir usando su mapeo hasta soltarlo.
+    """
+
+    def __init__(self, name, lock):
+        self.name = name
+        self.lock = lock
+        self._header_segment = shared_memory.SharedMemory(name=name)
+        self.header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=self._header_segment.buf)
+        self._segments = [None] * SLOTS
+
+    def write(self, request_id, t, y, geometry=None):
+        """Copiar una trayectoria en el búfer que la interfaz no tiene tomado y publicarla"""
+        t = np.asarray(t, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        frames = t.size
+        columns = y.shape[1] if y.ndim == 2 else 0
+        points = 0 if geometry is None else geometry.shape[1]
+
+        header = self.header
+        with self.lock:
+            held, published = int(header[HELD]), int(header[PUBLISHED])
+            slot = 1 - held if held >= 0 else (1 - published if published >= 0 else 0)
+            base = slot_base(slot)
+            header[base + WRITING] = 1
+
+        _, _, size = slot_layout(frames, columns, points)
+        segment, generation = self._reserve(slot, size)
+        t_view, y_view, geometry_view = slot_views(segment.buf, frames, columns, points)
+        t_view[:] = t
+        y_view[:] = y
+        if points:
+            geometry_view[:] = geometry
+        del t_view, y_view, geometry_view
+
+        with self.lock:
+            header[COUNTER] += 1
+            header[base:base + SLOT_FIELDS] = (
+                0, header[COUNTER], request_id, generation, frames, columns, points
+            )
+            header[PUBLISHED] = slot
+            header[PUBLISHED_SEQ] = header[COUNTER]
+
+    def _reserve(self, slot, size):
+        """Segmento de un búfer con al menos 'size' bytes: (SharedMemory, generación)"""
+        current = self._segments[slot]
+        if current is not None and current[1].size >= size:
+            return current[1], current[0]
+        generation = 0 if current is None else current[0] + 1
+        segment = shared_memory.SharedMemory(
+            create=True, name=segment_name(self.name, slot, generation),
+            size=max(8, int(size * GROWTH))
+        )
+        if current is not None:
+            current[1].close()
+            current[1].unlink()
+        self._segments[slot] = (generation, segment)
+        return segment, generation
+
+    def close(self):
+        """Eliminar los búferes de datos (el encabezado es de la interfaz)"""
+        for current in self._segments:
+            if current is not None:
+                current[1].close()
+                current[1].unlink()
+        self._segments = [None] * SLOTS
+        self.header = None
+        self._header_segment.close()
@@ -0,0 +1,110 @@
+"""
+Capturas de las gráficas: lectura rápida en Tk, composición y PNG en segundo plano
+"""
+
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from .perf_monitor import timed
+
+
+@timed("snapshot_capture")
+def capture_canvases(canvases):
+    """Copiar el búfer RGBA actual de cada canvas Agg (lo único que corre en el hilo de Tk)
+
+    Con blitting el búfer ya contiene el último frame dibujado, así que no
+    hace falta volver a renderizar las figuras: es una copia de memoria.
+    """
+    return [np.array(canvas.buffer_rgba()) for canvas in canvases]
+
+
+def compose_row(images, gap=20, background=(26, 30, 46, 255)):
+    """Unir imágenes RGBA en una fila, centradas verticalmente sobre un fondo"""
+    height = max(image.shape[0] for image in images)
+    width = sum(image.shape[1] for image in images) + gap * (len(images) - 1)
+    row = np.empty((height, width, 4), dtype=np.uint8)
+    row[:] = background
+    x = 0
+    for image in images:
+        top = (height - image.shape[0]) // 2
+        row[top:top + image.shape[0], x:x + image.shape[1]] = image
+        x += image.shape[1] + gap
+    return row
+
+
+@timed("snapshot_encode")
+def save_snapshot(images, path, gap=20):
+    """Componer las capturas y guardarlas como PNG (en el hilo de capturas)"""
+    from PIL import Image
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    Image.fromarray(compose_row(images, gap)[..., :3]).save(path, compress_level=3)
+    return path
+
+
+class SnapshotWorker:
+    """Guarda capturas en un hilo aparte con una cola acotada
+
+    submit() no bloquea nunca: si la cola está llena la captura se descarta
+    y devuelve False (p. ej. en ráfagas más rápidas que el disco). poll(),
+    desde el hilo de Tk, devuelve las capturas terminadas.
+    """
+
+    def __init__(self, max_pending=8, gap=20):
+        self.gap = gap
+        self._requests = queue.Queue(maxsize=max_pending)
+        self._done = queue.Queue()
+        self.pending = 0
+        self._thread = threading.Thread(target=self._run, name="SnapshotWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, images, path):
+        """Encolar una captura; False si la cola está llena"""
+        try:
+            self._requests.put_nowait((images, path))
+        except queue.Full:
+            return False
+        self.pending += 1
+        return True
+
+    def poll(self):
+        """Capturas terminadas desde la última llamada: lista de (ruta, error o None)"""
+        finished = []
+        while True:
+            try:
+                finished.append(self._done.get_nowait())
+            except queue.Empty:
+                break
+        self.pending -= len(finished)
+        return finished
+
+    def close(self, timeout=5.0):
+        """Terminar las capturas pendientes y detener el hilo, esperando a lo sumo 'timeout'
+
+        Si la cola sigue llena al vencer el plazo se abandona el hilo (es un
+        daemon) con las capturas que no alcanzó a guardar.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            self._requests.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+
+    def _run(self):
+        """Bucle del hilo de capturas"""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            images, path = request
+            try:
+                self._done.put((save_snapshot(images, path, self.gap), None))
+            except Exception as e:
+                self._done.put((path, e))
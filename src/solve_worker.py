@@ -0,0 +1,197 @@
+"""
+Resolución asíncrona del sistema en un hilo de trabajo o en otro proceso
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+
+from .spring_geometry import trajectory_geometry
+
+
+def solve_request(engine, chain_engine, parameters, t_max, num_points, precompute):
+    """Resolver una petición y precalcular su geometría: (t, y, geometría o None)
+
+    Las peticiones con 'num_masses' van al motor de la cadena, cuya geometría
+    se precalcula siempre.
+    """
+    if "num_masses" in parameters:
+        engine = chain_engine
+    engine.set_parameters(**parameters)
+    t, y = engine.solve_system(t_max=t_max, num_points=num_points)
+    geometry = trajectory_geometry(y) if precompute or y.ndim == 2 else None
+    return t, y, geometry
+
+
+class SolveWorker:
+    """Resuelve en segundo plano quedándose solo con la petición más reciente
+
+    Las peticiones se fusionan: si llegan varias mientras el hilo está ocupado,
+    solo se resuelve la última. Los resultados que ya no corresponden a la
+    última petición se descartan. poll() se llama desde el hilo de Tk.
+    'solve' es la tarea, con la firma de solve_request (p. ej. los picos de
+    la curva de resonancia).
+    """
+
+    def __init__(self, physics_engine, chain_engine=None, precompute=False,
+                 solve=solve_request):
+        # Motores exclusivos del hilo de trabajo (su caché no se comparte con Tk);
+        # las peticiones con 'num_masses' van al de la cadena
+        self.engine = physics_engine
+        self.chain_engine = chain_engine
+        # Precalcular también la geometría del resorte fuera del hilo de Tk
+        self.precompute = precompute
+        self.solve = solve
+        self._condition = threading.Condition()
+        self._pending = None
+        self._result = None
+        self._latest_id = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="SolveWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, parameters, t_max, num_points):
+        """Encolar una resolución, reemplazando cualquier petición aún no iniciada"""
+        with self._condition:
+            self._latest_id += 1
+            self._pending = (self._latest_id, dict(parameters), t_max, num_points)
+            self._condition.notify()
+            return self._latest_id
+
+    def poll(self):
+        """Obtener el último resultado vigente (id, parámetros, t, y, geometría) o None"""
+        with self._condition:
+            result, self._result = self._result, None
+        if result is None or result[0] != self._latest_id:
+            return None
+        return result
+
+    def close(self):
+        """Detener el hilo de trabajo"""
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify()
+
+    def _run(self):
+        """Bucle del hilo de trabajo"""
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                request_id, parameters, t_max, num_points = self._pending
+                self._pending = None
+
+            try:
+                t, y, geometry = self.solve(self.engine, self.chain_engine, parameters,
+                                            t_max, num_points, self.precompute)
+            except Exception as e:
+                print(f"Error al resolver el sistema: {e}")
+                continue
+
+            with self._condition:
+                # Descartar resultados obsoletos: ya hay una petición más nueva
+                if request_id == self._latest_id:
+                    self._result = (request_id, parameters, t, y, geometry)
+
+
+def latest_request(requests):
+    """Esperar una petición y descartar las que ya tienen otra más nueva detrás
+
+    Devuelve None cuando llega la señal de cierre.
+    """
+    request = requests.get()
+    while request is not None:
+        try:
+            request = requests.get_nowait()
+        except queue.Empty:
+            break
+    return request
+
+
+def solve_process(requests, channel_args, options, precompute):
+    """Bucle del proceso de resolución: resuelve la última petición y la publica"""
+    # Importaciones dentro del proceso hijo: el padre no las necesita para crearlo
+    from .chain_engine import ChainEngine
+    from .physics_engine import PhysicsEngine
+    from .shared_trajectory import TrajectoryWriter
+    from .trajectory_atlas import TrajectoryAtlas
+    from .trajectory_cache import TrajectoryCache
+
+    atlas = None
+    if options.get("atlas_path") and os.path.isdir(options["atlas_path"]):
+        try:
+            atlas = TrajectoryAtlas(options["atlas_path"])
+        except (OSError, ValueError) as e:
+            print(f"No se pudo abrir el atlas '{options['atlas_path']}': {e}")
+    engine = PhysicsEngine(method=options["method"],
+                           cache=TrajectoryCache(options["cache_bytes"]), atlas=atlas)
+    chain_engine = ChainEngine(method=options["chain_method"])
+    writer = TrajectoryWriter(*channel_args)
+    try:
+        while True:
+            request = latest_request(requests)
+            if request is None:
+                return
+            request_id, parameters, t_max, num_points = request
+            try:
+                t, y, geometry = solve_request(engine, chain_engine, parameters,
+                                               t_max, num_points, precompute)
+            except Exception as e:
+                print(f"Error al resolver el sistema: {e}")
+                continue
+            writer.write(request_id, t, y, geometry)
+    finally:
+        writer.close()
+
+
+class ProcessSolveWorker:
+    """Como SolveWorker, pero resuelve en un proceso aparte (sin compartir el GIL con Tk)
+
+    Solo viajan serializados los parámetros de cada petición; las trayectorias
+    vuelven por memoria compartida de doble búfer (TrajectoryChannel). poll()
+    devuelve vistas sin copias, válidas hasta que devuelva el siguiente
+    resultado. options: method, cache_bytes, atlas_path y chain_method.
+    """
+
+    def __init__(self, options, precompute=False):
+        from .shared_trajectory import TrajectoryChannel
+
+        context = multiprocessing.get_context("spawn")
+        self.channel = TrajectoryChannel(context)
+        self._requests = context.Queue()
+        self._latest_id = 0
+        self._parameters = None
+        self._process = context.Process(
+            target=solve_process,
+            args=(self._requests, self.channel.writer_args(), dict(options), precompute),
+            name="SolveProcess", daemon=True
+        )
+        self._process.start()
+
+    def submit(self, parameters, t_max, num_points):
+        """Enviar una resolución; el proceso descarta las que queden atrasadas"""
+        self._latest_id += 1
+        self._parameters = dict(parameters)
+        self._requests.put((self._latest_id, self._parameters, t_max, num_points))
+        return self._latest_id
+
+    def poll(self):
+        """Obtener el último resultado vigente (id, parámetros, t, y, geometría) o None"""
+        result = self.channel.acquire(self._latest_id)
+        if result is None:
+            return None
+        request_id, t, y, geometry = result
+        return request_id, self._parameters, t, y, geometry
+
+    def close(self):
+        """Detener el proceso y liberar la memoria compartida"""
+        self._requests.put(None)
+        self._process.join(timeout=0.5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self.channel.close()
@@ -0,0 +1,138 @@
+"""
+Geometría del resorte y de la cadena de masas (solo numpy)
+
+No depende de matplotlib: los hilos y procesos de resolución pueden
+precalcular aquí la geometría de una trayectoria antes de entregarla.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Posiciones de la pared y del equilibrio en el canvas de animación
+WALL_X = -6
+EQUILIBRIUM_X = 0
+
+# Geometría del resorte
+SPRING_POINTS = 150
+MIN_COILS = 5
+MAX_COILS = 20
+
+# Geometría de la cadena de masas
+CHAIN_POINTS = 4000
+CHAIN_MAX_COIL_POINTS = 8
+CHAIN_COIL_AMPLITUDE = 0.15
+CHAIN_PROFILE_BASE = -1.3
+CHAIN_PROFILE_HEIGHT = 0.45
+
+
+@lru_cache(maxsize=None)
+def spring_templates():
+    """Rampa unitaria en x y perfiles en y ya suavizados para cada número de espiras
+
+    n_coils está limitado a enteros entre MIN_COILS y MAX_COILS, así que solo
+    existen MAX_COILS - MIN_COILS + 1 ondulaciones distintas. Devuelve
+    (rampa, perfiles) con perfiles[n - MIN_COILS] para n espiras.
+    """
+    ramp = np.linspace(0, 1, SPRING_POINTS)
+    coils = np.arange(MIN_COILS, MAX_COILS + 1)[:, None]
+    main_wave = 0.15 * np.sin(coils * 2 * np.pi * ramp)
+    secondary_wave = 0.03 * np.sin(coils * 4 * np.pi * ramp + np.pi/4)
+    tertiary_wave = 0.02 * np.sin(coils * 6 * np.pi * ramp + np.pi/2)
+
+    # Suavizar extremos
+    window = np.ones(SPRING_POINTS)
+    window[:10] = np.linspace(0, 1, 10)
+    window[-10:] = np.linspace(1, 0, 10)
+    profiles = (main_wave + secondary_wave + tertiary_wave) * window
+
+    ramp.setflags(write=False)
+    profiles.setflags(write=False)
+    return ramp, profiles
+
+
+def spring_frames(positions, wall_x, equilibrium_x):
+    """Geometría del resorte para toda una trayectoria en una sola pasada
+
+    Equivale a llamar create_spring_coords para cada desplazamiento. Devuelve
+    un arreglo float32 de forma (frames, SPRING_POINTS, 2) con x e y.
+    """
+    ramp, profiles = spring_templates()
+    positions = np.asarray(positions, dtype=float)
+    natural_length = abs(equilibrium_x - wall_x)
+    mass_x = equilibrium_x + positions
+
+    # Límites físicos suaves
+    min_compression = wall_x + 0.5
+    max_stretch = wall_x + natural_length * 3
+    mass_x = np.where(
+        mass_x < min_compression,
+        min_compression + (positions + (min_compression - equilibrium_x)) * 0.1,
+        np.where(
+            mass_x > max_stretch,
+            max_stretch - (positions - (max_stretch - equilibrium_x)) * 0.1,
+            mass_x
+        )
+    )
+
+    spring_length = mass_x - wall_x
+    n_coils = np.clip((12 * (spring_length / natural_length)).astype(int), MIN_COILS, MAX_COILS)
+
+    frames = np.empty((positions.size, SPRING_POINTS, 2), dtype=np.float32)
+    frames[:, :, 0] = wall_x + ramp * spring_length[:, None]
+    frames[:, :, 1] = profiles[n_coils - MIN_COILS]
+    return frames
+
+
+def chain_points_per_spring(num_masses):
+    """Puntos por resorte de la cadena, dentro del presupuesto CHAIN_POINTS por frame"""
+    return int(np.clip(CHAIN_POINTS // num_masses, 1, CHAIN_MAX_COIL_POINTS))
+
+
+def chain_frames(positions, wall_x, length, profile_base, profile_height):
+    """Geometría de una cadena de masas para toda una trayectoria en una sola pasada
+
+    positions tiene forma (frames, N). Devuelve un arreglo float32 de forma
+    (frames, 1 + N·s + N, 2): primero la línea de resortes desde la pared
+    (s puntos por resorte, el último sobre la masa) y después el perfil de
+    desplazamientos (x de equilibrio de cada masa, y escalada a profile_height).
+    """
+    positions = np.asarray(positions, dtype=float)
+    frames, n = positions.shape
+    s = chain_points_per_spring(n)
+    rest_x = wall_x + length / n * np.arange(1, n + 1)
+    mass_x = rest_x + positions
+    left_x = np.empty_like(mass_x)
+    left_x[:, 0] = wall_x
+    left_x[:, 1:] = mass_x[:, :-1]
+
+    # Zigzag: puntos intermedios alternados arriba y abajo, el último sobre el eje
+    # (más bajo cuanto más juntas están las masas)
+    fractions = np.arange(1, s + 1) / s
+    zigzag = np.zeros(s)
+    zigzag[:-1] = CHAIN_COIL_AMPLITUDE * min(1.0, length / n) * (-1.0) ** np.arange(s - 1)
+
+    springs = 1 + n * s
+    geometry = np.empty((frames, springs + n, 2), dtype=np.float32)
+    geometry[:, 0] = (wall_x, 0)
+    geometry[:, 1:springs, 0] = (
+        left_x[:, :, None] + (mass_x - left_x)[:, :, None] * fractions
+    ).reshape(frames, n * s)
+    geometry[:, 1:springs, 1] = np.tile(zigzag, n)
+    peak = np.abs(positions).max() if positions.size else 0
+    geometry[:, springs:, 0] = rest_x
+    geometry[:, springs:, 1] = profile_base + positions * (profile_height / peak if peak > 0 else 0)
+    return geometry
+
+
+def trajectory_geometry(solution_y):
+    """Geometría de todos los frames con la disposición del canvas de animación
+
+    Un arreglo 1-D es el desplazamiento de una sola masa (spring_frames) y
+    uno 2-D de forma (frames, N) el de una cadena (chain_frames).
+    """
+    solution_y = np.asarray(solution_y)
+    if solution_y.ndim == 1:
+        return spring_frames(solution_y, WALL_X, EQUILIBRIUM_X)
+    return chain_frames(solution_y, WALL_X, 2 * (EQUILIBRIUM_X - WALL_X),
+                        CHAIN_PROFILE_BASE, CHAIN_PROFILE_HEIGHT)
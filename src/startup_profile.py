@@ -0,0 +1,113 @@
+"""
+Medición del arranque: tiempo de importación por módulo e hitos
+
+Solo usa la biblioteca estándar para no sumar tiempo a lo que mide. Se
+instala antes de cualquier otra importación (python main.py --startup-times).
+"""
+
+import sys
+import threading
+import time
+
+
+class ImportTimer:
+    """Buscador de sys.meta_path que cronometra la ejecución de cada módulo importado
+
+    No resuelve nada por sí mismo: delega en los buscadores siguientes y
+    envuelve el exec_module del cargador devuelto. Registra el tiempo
+    inclusivo (con los módulos que importa) y el propio de cada módulo, como
+    python -X importtime, además del hilo en que se importó.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.modules = {}
+        self.milestones = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def install(self):
+        """Registrar el buscador al frente de sys.meta_path"""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Quitar el buscador (lo ya medido se conserva)"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        """Delegar la búsqueda y envolver el cargador del módulo encontrado"""
+        finders = sys.meta_path[sys.meta_path.index(self) + 1:]
+        for finder in finders:
+            find_spec = getattr(finder, "find_spec", None)
+            spec = find_spec(name, path, target) if find_spec else None
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Los módulos integrados y congelados usan la clase como cargador
+        # (compartida): no se envuelven, y su costo es despreciable
+        if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+            loader.exec_module = self._wrap(name, loader.exec_module)
+        return spec
+
+    def _wrap(self, name, exec_module):
+        """exec_module cronometrado con pila por hilo para separar el tiempo propio"""
+        def timed_exec(module):
+            stack = getattr(self._local, "stack", None)
+            if stack is None:
+                stack = self._local.stack = []
+            frame = [time.perf_counter(), 0.0]
+            stack.append(frame)
+            try:
+                exec_module(module)
+            finally:
+                stack.pop()
+                inclusive = time.perf_counter() - frame[0]
+                if stack:
+                    stack[-1][1] += inclusive
+                with self._lock:
+                    self.modules[name] = (inclusive, inclusive - frame[1],
+                                          threading.current_thread().name)
+        return timed_exec
+
+    def mark(self, label):
+        """Registrar un hito con el tiempo transcurrido desde la instalación"""
+        with self._lock:
+            self.milestones.append((label, time.perf_counter() - self.start))
+
+    def report(self, limit=25, file=None):
+        """Imprimir los hitos y los módulos más lentos (tiempo inclusivo)"""
+        file = file or sys.stdout
+        with self._lock:
+            modules = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+            milestones = list(self.milestones)
+        print("Arranque (ms desde el inicio de la medición):", file=file)
+        for label, elapsed in milestones:
+            print(f"  {elapsed * 1000:9.1f}  {label}", file=file)
+        print(f"Importaciones ({len(modules)} módulos, los {min(limit, len(modules))} más lentos):",
+              file=file)
+        print(f"  {'inclusivo':>9}  {'propio':>8}  módulo", file=file)
+        for name, (inclusive, own, thread) in modules[:limit]:
+            where = "" if thread == "MainThread" else f"  [{thread}]"
+            print(f"  {inclusive * 1000:9.1f}  {own * 1000:8.1f}  {name}{where}", file=file)
+
+
+# Medidor activo (None si no se pidió la medición)
+active = None
+
+
+def start():
+    """Crear e instalar el medidor global"""
+    global active
+    active = ImportTimer()
+    active.install()
+    return active
+
+
+def mark(label):
+    """Registrar un hito si la medición está activa (sin costo si no lo está)"""
+    if active is not None:
+        active.mark(label)
@@ -0,0 +1,180 @@
+"""
+Atlas precalculado de trayectorias sobre la malla de parámetros
+
+El sistema es lineal en la amplitud de la fuerza, así que el atlas guarda la
+respuesta a F0 = 1 y la escala al consultar. La fuerza escalón no depende de
+la frecuencia, por lo que solo guarda una fila por (m, k, c).
+
+Construcción (paso fuera de línea):
+
+    python -m src.trajectory_atlas build atlas/ --force-types Coseno Seno
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+from .config import PARAMETER_LIMITS, ANIMATION_CONFIG, PHYSICS_CONFIG
+from .physics_engine import PhysicsEngine
+from .trajectory_cache import quantize_parameter
+
+ATLAS_FORCE_TYPES = ("Coseno", "Seno", "Pulso", "Escalón")
+
+# Ejes de la malla almacenados (la amplitud se factoriza)
+ATLAS_AXES = ("mass", "stiffness", "damping", "frequency")
+
+DATA_FILE = "atlas.npy"
+INDEX_FILE = "atlas.json"
+
+
+def lattice_axis(name):
+    """Índices de malla (valor / step) de un parámetro según PARAMETER_LIMITS"""
+    limits = PARAMETER_LIMITS[name]
+    first = round(limits["min"] / limits["step"])
+    last = round(limits["max"] / limits["step"])
+    return first, last - first + 1
+
+
+def _axes_for(force_type):
+    """Ejes que definen una fila para un tipo de fuerza"""
+    return ATLAS_AXES[:3] if force_type == "Escalón" else ATLAS_AXES
+
+
+def build_atlas(directory, force_types=ATLAS_FORCE_TYPES, t_max=None, num_points=None,
+                method=None, chunk_size=4096, progress=None):
+    """Precalcular el atlas completo y guardarlo en 'directory'
+
+    Escribe un .npy float32 (una fila por punto de la malla) y un índice JSON
+    con la geometría de la malla. Devuelve la ruta del índice.
+    """
+    t_max = ANIMATION_CONFIG["simulation_time"] if t_max is None else t_max
+    num_points = ANIMATION_CONFIG["frames"] if num_points is None else num_points
+    method = PHYSICS_CONFIG["solver_method"] if method is None else method
+
+    axes = {name: lattice_axis(name) for name in ATLAS_AXES}
+    sections = {}
+    total_rows = 0
+    for force_type in force_types:
+        rows = int(np.prod([axes[name][1] for name in _axes_for(force_type)]))
+        sections[force_type] = {"offset": total_rows, "rows": rows}
+        total_rows += rows
+
+    os.makedirs(directory, exist_ok=True)
+    data = np.lib.format.open_memmap(
+        os.path.join(directory, DATA_FILE), mode="w+", dtype=np.float32,
+        shape=(total_rows, num_points)
+    )
+
+    engine = PhysicsEngine(method=method)
+    done = 0
+    for force_type in force_types:
+        names = _axes_for(force_type)
+        shape = tuple(axes[name][1] for name in names)
+        offset = sections[force_type]["offset"]
+        for start in range(0, sections[force_type]["rows"], chunk_size):
+            flat = np.arange(start, min(start + chunk_size, sections[force_type]["rows"]))
+            grid = np.unravel_index(flat, shape)
+            values = {
+                name: (axes[name][0] + index) * PARAMETER_LIMITS[name]["step"]
+                for name, index in zip(names, grid)
+            }
+            _, displacement = engine.solve_batch(
+                values["mass"], values["stiffness"], values["damping"], 1.0,
+                values.get("frequency", 1.0), force_type,
+                t_max=t_max, num_points=num_points
+            )
+            data[offset + flat] = displacement
+            done += flat.size
+            if progress:
+                progress(done, total_rows)
+    data.flush()
+    del data
+
+    index = {
+        "t_max": t_max,
+        "num_points": num_points,
+        "method": method,
+        "axes": {name: {"first": first, "size": size} for name, (first, size) in axes.items()},
+        "sections": sections,
+    }
+    index_path = os.path.join(directory, INDEX_FILE)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    return index_path
+
+
+class TrajectoryAtlas:
+    """Consulta O(1) de trayectorias precalculadas mapeadas en memoria"""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, INDEX_FILE), encoding="utf-8") as f:
+            self.index = json.load(f)
+        # Vista ndarray del memmap: evita la sobrecarga de np.memmap al indexar filas
+        self.data = np.load(os.path.join(directory, DATA_FILE), mmap_mode="r").view(np.ndarray)
+        self.t_max = self.index["t_max"]
+        self.num_points = self.index["num_points"]
+        self.method = self.index["method"]
+        self.t_eval = np.linspace(0, self.t_max, self.num_points)
+        self.t_eval.setflags(write=False)
+
+    def row_index(self, parameters):
+        """Fila del atlas para unos parámetros, o None si no están en la malla"""
+        section = self.index["sections"].get(parameters.get("force_type", "Coseno"))
+        if section is None:
+            return None
+
+        row = 0
+        for name in _axes_for(parameters.get("force_type", "Coseno")):
+            kind, index = quantize_parameter(name, parameters[name])
+            axis = self.index["axes"][name]
+            position = index - axis["first"] if kind == "q" else -1
+            if not 0 <= position < axis["size"]:
+                return None
+            row = row * axis["size"] + position
+        return section["offset"] + row
+
+    def lookup(self, parameters, t_max, num_points, method):
+        """Obtener (t, y) del atlas, o None si la consulta no puede servirse"""
+        if (method != self.method or num_points != self.num_points
+                or not math.isclose(t_max, self.t_max)):
+            return None
+        kind, _ = quantize_parameter("force_amplitude", parameters["force_amplitude"])
+        if kind != "q":
+            return None
+        row = self.row_index(parameters)
+        if row is None:
+            return None
+        return self.t_eval, parameters["force_amplitude"] * self.data[row].astype(float)
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos para construir el atlas"""
+    parser = argparse.ArgumentParser(description="Atlas precalculado de trayectorias")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Construir el atlas sobre la malla completa")
+    build.add_argument("directory")
+    build.add_argument("--force-types", nargs="+", default=list(ATLAS_FORCE_TYPES),
+                       choices=ATLAS_FORCE_TYPES)
+    build.add_argument("--t-max", type=float, default=None)
+    build.add_argument("--num-points", type=int, default=None)
+    build.add_argument("--method", default=None)
+    build.add_argument("--chunk-size", type=int, default=4096)
+    args = parser.parse_args(argv)
+
+    def report(done, total):
+        sys.stderr.write(f"\r{done}/{total} trayectorias ({100 * done / total:.1f}%)")
+        sys.stderr.flush()
+
+    index_path = build_atlas(
+        args.directory, tuple(args.force_types), args.t_max, args.num_points,
+        args.method, args.chunk_size, progress=report
+    )
+    sys.stderr.write(f"\nAtlas guardado en {index_path}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Caché LRU de trayectorias resueltas
+"""
+
+from collections import OrderedDict
+
+from .config import PARAMETER_LIMITS
+
+# Tolerancia relativa para considerar que un valor cae sobre la malla de pasos
+_LATTICE_TOL = 1e-9
+
+
+def quantize_parameter(name, value):
+    """Llevar un parámetro a su índice en la malla de PARAMETER_LIMITS
+
+    ControlPanel acumula sumas de 'step', así que 0.1 + 0.2 y 0.3 deben dar la
+    misma clave. Los valores fuera de la malla (p. ej. presets) se conservan
+    tal cual para no confundirlos con un punto vecino.
+    """
+    limits = PARAMETER_LIMITS.get(name)
+    if limits is None:
+        return ("x", value)
+    step = limits["step"]
+    index = round(value / step)
+    if abs(index * step - value) <= _LATTICE_TOL * max(1.0, abs(value)):
+        return ("q", index)
+    return ("x", float(value))
+
+
+class TrajectoryCache:
+    """Caché LRU de trayectorias (t, y) acotada por memoria"""
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def make_key(parameters, t_max, num_points, method):
+        """Construir la clave a partir de los parámetros cuantizados y la malla temporal"""
+        quantized = tuple(
+            (name, quantize_parameter(name, parameters[name]))
+            for name in ("mass", "stiffness", "damping", "force_amplitude", "frequency")
+        )
+        return quantized + (parameters.get("force_type", "Coseno"), float(t_max), int(num_points), method)
+
+    def get(self, key):
+        """Obtener una trayectoria (t, y) o None si no está en caché"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, t, y):
+        """Guardar una trayectoria, desalojando las menos recientes si hace falta"""
+        size = t.nbytes + y.nbytes
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            old_t, old_y = self._entries.pop(key)
+            self.current_bytes -= old_t.nbytes + old_y.nbytes
+
+        while self._entries and self.current_bytes + size > self.max_bytes:
+            _, (old_t, old_y) = self._entries.popitem(last=False)
+            self.current_bytes -= old_t.nbytes + old_y.nbytes
+            self.evictions += 1
+
+        # Las entradas se comparten entre llamadas: protegerlas contra escritura
+        t.setflags(write=False)
+        y.setflags(write=False)
+        self._entries[key] = (t, y)
+        self.current_bytes += size
+
+    def clear(self):
+        """Vaciar la caché (los contadores se conservan)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """Obtener estadísticas de uso de la caché"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -92,11 +92,20 @@ class InfoPanel:
                         fg="#00D4FF", font=("Arial", 12, "bold"))
         title.pack(pady=5)
         
+        # Avisos breves (p. ej. capturas guardadas)
+        self.notice_label = tk.Label(self.frame, text="", bg="#16213E", fg="#FFD166",
+                                     font=("Arial", 9, "bold"), anchor=tk.W)
+        self.notice_label.pack(fill=tk.X)
+        self.notice_timer = None
+        
         # Estado del sistema
         self.create_system_info()
         
         # Consejos
         self.create_tips_section()
+        
+        # Rendimiento (oculto hasta activarlo)
+        self.create_perf_section()
     
     def create_system_info(self):
         """Crear sección de información del sistema"""
@@ -116,6 +125,7 @@ class InfoPanel:
         """Crear sección de consejos"""
         tips_frame = tk.Frame(self.frame, bg="#0F3460", relief="groove", bd=1, padx=8, pady=2)
         tips_frame.pack(fill=tk.BOTH, expand=True, pady=2)
+        self.tips_frame = tips_frame
         
         tips_title = tk.Label(tips_frame, text="💡 CONSEJOS", bg="#0F3460",
                              fg="#FF2E63", font=("Arial", 10, "bold"))
@@ -126,6 +136,26 @@ class InfoPanel:
         self.tips_text.pack(fill=tk.BOTH, expand=True, pady=2)
         self.tips_text.config(state=tk.DISABLED)
     
+    def create_perf_section(self):
+        """Crear sección de rendimiento (se muestra con show_perf)"""
+        self.perf_frame = tk.Frame(self.frame, bg="#0F3460", relief="groove", bd=1, padx=8, pady=2)
+        
+        perf_title = tk.Label(self.perf_frame, text="⏱️ RENDIMIENTO", bg="#0F3460",
+                             fg="#FFD166", font=("Arial", 10, "bold"))
+        perf_title.pack(anchor=tk.W)
+        
+        self.perf_text = tk.Text(self.perf_frame, height=6, width=30, bg="#0F3460", fg="white",
+                                font=("Courier", 8), wrap=tk.NONE, relief="flat")
+        self.perf_text.pack(fill=tk.BOTH, expand=True, pady=2)
+        self.perf_text.config(state=tk.DISABLED)
+    
+    def show_perf(self, visible):
+        """Mostrar u ocultar la sección de rendimiento"""
+        if visible:
+            self.perf_frame.pack(fill=tk.X, pady=2, before=self.tips_frame)
+        else:
+            self.perf_frame.pack_forget()
+    
     def update_system_info(self, info_text):
         """Actualizar información del sistema"""
         self.system_text.config(state=tk.NORMAL)
@@ -133,6 +163,25 @@ class InfoPanel:
         self.system_text.insert(tk.END, info_text)
         self.system_text.config(state=tk.DISABLED)
     
+    def update_perf(self, perf_text):
+        """Actualizar estadísticas de rendimiento"""
+        self.perf_text.config(state=tk.NORMAL)
+        self.perf_text.delete(1.0, tk.END)
+        self.perf_text.insert(tk.END, perf_text)
+        self.perf_text.config(state=tk.DISABLED)
+    
+    def show_notice(self, notice_text, duration_ms=4000):
+        """Mostrar un aviso que se borra solo pasado 'duration_ms'"""
+        if self.notice_timer:
+            self.frame.after_cancel(self.notice_timer)
+        self.notice_label.config(text=notice_text)
+        self.notice_timer = self.frame.after(duration_ms, self.clear_notice)
+    
+    def clear_notice(self):
+        """Borrar el aviso actual"""
+        self.notice_timer = None
+        self.notice_label.config(text="")
+    
     def update_tips(self, tip_text):
         """Actualizar consejos"""
         self.tips_text.config(state=tk.NORMAL)
@@ -2,22 +2,62 @@
 Pantalla de bienvenida del Laboratorio Virtual
 """
 
+import importlib
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from .config import COLORS
-from .mass_spring_app import MassSpringApp
+from . import startup_profile
+from .config import COLORS, STARTUP_CONFIG
+
+# Módulos pesados del laboratorio (matplotlib, scipy): la bienvenida solo
+# necesita tkinter, así que se importan en segundo plano mientras se lee
+PREWARM_MODULES = (
+    f"{__package__}.mass_spring_app",
+    "scipy.integrate",
+    "scipy.linalg",
+    "scipy.signal",
+    "scipy.sparse",
+)
+
+
+def prewarm_imports(modules=PREWARM_MODULES):
+    """Importar de antemano los módulos del laboratorio (en un hilo aparte)"""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            print(f"No se pudo precargar '{name}': {e}")
+            return
+    startup_profile.mark("precarga terminada")
+
 
 class WelcomeScreen:
     def __init__(self, root):
+        # Única ventana de la aplicación: la bienvenida y el laboratorio son
+        # frames que se muestran y ocultan dentro de ella
         self.root = root
-        self.root.title("Bienvenido al Laboratorio Virtual")
-        self.root.attributes('-fullscreen', True)
-        self.root.configure(bg=COLORS["primary"])
+        self.lab = None
+        self.frame = None
+        self.setup_window()
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_application)
 
         # Configurar estilo moderno
         self.setup_styles()
         self.setup_welcome_screen()
+
+        if STARTUP_CONFIG["prewarm"]:
+            self.root.after(STARTUP_CONFIG["prewarm_delay_ms"], self.start_prewarm)
+
+    def setup_window(self):
+        """Configurar la ventana para la bienvenida"""
+        self.root.title("Bienvenido al Laboratorio Virtual")
+        self.root.attributes('-fullscreen', True)
+        self.root.configure(bg=COLORS["primary"])
+
+    def start_prewarm(self):
+        """Lanzar la precarga del laboratorio una vez dibujada la bienvenida"""
+        threading.Thread(target=prewarm_imports, name="Prewarm", daemon=True).start()
         
     def setup_styles(self):
         style = ttk.Style()
@@ -26,7 +66,7 @@ class WelcomeScreen:
         # Colores modernos
         style.configure("Modern.TFrame", background=COLORS["primary"])
         style.configure(
-            "Title.TLabel",
+            "WelcomeTitle.TLabel",
             background=COLORS["primary"],
             foreground=COLORS["accent1"],
             font=("Arial", 28, "bold"),
@@ -52,7 +92,7 @@ class WelcomeScreen:
 
     def setup_welcome_screen(self):
         # Frame principal con gradiente
-        main_frame = ttk.Frame(self.root, style="Modern.TFrame", padding=10)
+        main_frame = self.frame = ttk.Frame(self.root, style="Modern.TFrame", padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Logo/Icono
@@ -63,7 +103,7 @@ class WelcomeScreen:
 
         # Título principal
         title_label = ttk.Label(
-            main_frame, text="LABORATORIO VIRTUAL", style="Title.TLabel"
+            main_frame, text="LABORATORIO VIRTUAL", style="WelcomeTitle.TLabel"
         )
         title_label.pack(pady=2)
 
@@ -166,13 +206,32 @@ class WelcomeScreen:
         ttk.Button(
             button_frame,
             text="🚪 SALIR",
-            command=self.root.quit, 
+            command=self.quit_application,
             style="Exit.TButton"
         ).pack(side=tk.LEFT, padx=15)
         
 
+    def show(self):
+        """Volver a mostrar la bienvenida (desde el laboratorio)"""
+        self.setup_window()
+        self.frame.pack(fill=tk.BOTH, expand=True)
+
     def start_lab(self):
-        self.root.destroy()
-        root = tk.Tk()
-        app = MassSpringApp(root)
-        root.mainloop()
\ No newline at end of file
+        """Ocultar la bienvenida y mostrar el laboratorio, creándolo solo la primera vez"""
+        self.frame.pack_forget()
+        if self.lab is not None:
+            self.lab.show()
+            return
+
+        # Ya importado si la precarga terminó; si no, espera a que termine
+        from .mass_spring_app import MassSpringApp
+
+        self.lab = MassSpringApp(self.root, on_home=self.show)
+        startup_profile.mark("laboratorio creado")
+
+    def quit_application(self):
+        """Salir de la aplicación, deteniendo el laboratorio si llegó a crearse"""
+        if self.lab is not None:
+            self.lab.stop_background_tasks()
+        self.root.quit()
+        self.root.destroy()
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""
+Configuración de pytest: permite importar el paquete src desde la raíz del repositorio
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
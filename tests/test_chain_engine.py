@@ -0,0 +1,61 @@
+"""
+Jacobiano de banda de la cadena frente a diferencias finitas del lado derecho
+"""
+
+import numpy as np
+import pytest
+
+from src.chain_engine import (
+    BANDWIDTH, ChainEngine, chain_jacobian, chain_matrices, compile_chain_rhs,
+)
+from src.physics_engine import PhysicsEngine
+
+
+def finite_difference_jacobian(rhs, state, step=1e-6):
+    """Jacobiano por diferencias centradas, columna a columna"""
+    size = state.size
+    jacobian = np.empty((size, size))
+    for j in range(size):
+        delta = np.zeros(size)
+        delta[j] = step
+        jacobian[:, j] = (np.asarray(rhs(0.3, state + delta))
+                          - np.asarray(rhs(0.3, state - delta))) / (2 * step)
+    return jacobian
+
+
+@pytest.mark.parametrize("fixed_end", [False, True], ids=["extremo_libre", "extremo_fijo"])
+def test_jacobian_matches_finite_differences(fixed_end):
+    rng = np.random.default_rng(0)
+    n = 7
+    masses = rng.uniform(0.5, 2.0, n)
+    stiffnesses = rng.uniform(1.0, 10.0, n + 1)
+    dampings = rng.uniform(0.0, 1.0, n + 1)
+    if not fixed_end:
+        stiffnesses[-1] = dampings[-1] = 0.0
+
+    # La fuerza no depende del estado: no aporta al jacobiano
+    rhs = compile_chain_rhs(masses, stiffnesses, dampings, lambda t: 2.0 * np.cos(t), driven=3)
+    jacobian = chain_jacobian(masses, *chain_matrices(stiffnesses, dampings)).toarray()
+
+    expected = finite_difference_jacobian(rhs, rng.normal(size=2 * n))
+    np.testing.assert_allclose(jacobian, expected, rtol=0, atol=1e-7)
+
+    # Con el estado intercalado, la matriz es de banda con semiancho BANDWIDTH
+    rows, columns = np.nonzero(jacobian)
+    assert np.max(np.abs(rows - columns)) <= BANDWIDTH
+
+
+@pytest.mark.parametrize("method", ["RK45", "Radau", "LSODA"])
+@pytest.mark.parametrize("force_type", ["Coseno", "Escalón"])
+def test_single_mass_chain_matches_physics_engine(method, force_type):
+    chain = ChainEngine(method=method)
+    chain.set_parameters(1.0, 4.0, 0.5, 3.0, 1.5, force_type)
+    single = PhysicsEngine(method="analytic")
+    single.set_parameters(1.0, 4.0, 0.5, 3.0, 1.5, force_type)
+
+    t_chain, positions = chain.solve_system(t_max=10, num_points=200)
+    t_single, y = single.solve_system(t_max=10, num_points=200)
+    np.testing.assert_array_equal(t_chain, t_single)
+    assert positions.shape == (200, 1)
+    # La cadena usa las tolerancias por defecto de solve_ivp (rtol = 1e-3)
+    np.testing.assert_allclose(positions[:, 0], y, rtol=0, atol=1e-2 * np.max(np.abs(y)))
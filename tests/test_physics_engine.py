@@ -0,0 +1,71 @@
+"""
+Solución analítica frente a solve_ivp con tolerancias estrictas
+"""
+
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from src.physics_engine import ANALYTIC_FORCE_TYPES, PhysicsEngine, force_edges
+
+MASS, STIFFNESS, AMPLITUDE, FREQUENCY = 1.0, 4.0, 3.0, 2.0
+
+# Con m = 1 y k = 4 el amortiguamiento crítico es c = 4; sin amortiguamiento y
+# ω = √(k/m) = 2 las fuerzas armónicas están en resonancia exacta
+DAMPING_REGIMES = {
+    "sin_amortiguamiento": 0.0,
+    "subamortiguado": 0.5,
+    "critico": 4.0,
+    "sobreamortiguado": 6.0,
+}
+
+
+def reference_solution(engine, t_eval):
+    """Integrar con DOP853 y tolerancias estrictas, por tramos entre los saltos de la fuerza"""
+    p = engine.parameters
+    m, k, c = p['mass'], p['stiffness'], p['damping']
+    edges = force_edges(p['force_type'], p['frequency'], t_eval[0], t_eval[-1])
+    bounds = np.concatenate(([t_eval[0]], edges, [t_eval[-1]]))
+    y = np.empty(t_eval.size)
+    state = np.zeros(2)
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        # Dentro de un tramo la fuerza es continua: se evalúa en t, salvo Pulso
+        # y Escalón, constantes en el tramo (así el valor en el salto no importa)
+        if edges.size:
+            force = float(engine.external_force(0.5 * (a + b)))
+            forcing = lambda t, force=force: force
+        else:
+            forcing = engine.external_force
+
+        def rhs(t, Y, forcing=forcing):
+            return [Y[1], (forcing(t) - c * Y[1] - k * Y[0]) / m]
+
+        sol = solve_ivp(rhs, [a, b], state, method="DOP853", rtol=1e-11, atol=1e-12,
+                        dense_output=True)
+        inside = (t_eval >= a) & ((t_eval < b) | (b == t_eval[-1]))
+        y[inside] = sol.sol(t_eval[inside])[0]
+        state = sol.y[:, -1]
+    return y
+
+
+@pytest.mark.parametrize("damping", DAMPING_REGIMES.values(), ids=DAMPING_REGIMES.keys())
+@pytest.mark.parametrize("force_type", ANALYTIC_FORCE_TYPES)
+def test_analytic_matches_solve_ivp(force_type, damping):
+    engine = PhysicsEngine(method="analytic")
+    engine.set_parameters(MASS, STIFFNESS, damping, AMPLITUDE, FREQUENCY, force_type)
+    t, y = engine.solve_system(t_max=17, num_points=800)
+
+    expected = reference_solution(engine, t)
+    scale = max(1.0, np.max(np.abs(expected)))
+    np.testing.assert_allclose(y, expected, rtol=0, atol=1e-7 * scale)
+
+
+@pytest.mark.parametrize("force_type", ANALYTIC_FORCE_TYPES)
+def test_auto_uses_analytic_solution(force_type):
+    engine = PhysicsEngine(method="auto")
+    engine.set_parameters(MASS, STIFFNESS, 0.5, AMPLITUDE, FREQUENCY, force_type)
+    assert engine.has_analytic_solution()
+    t, y = engine.solve_system(t_max=10, num_points=200)
+    t_analytic, y_analytic = engine.solve_system(t_max=10, num_points=200, method="analytic")
+    np.testing.assert_array_equal(t, t_analytic)
+    np.testing.assert_array_equal(y, y_analytic)
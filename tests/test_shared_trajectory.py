@@ -0,0 +1,113 @@
+"""
+Ida y vuelta de trayectorias por memoria compartida (escritor y canal en el mismo proceso)
+"""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from src.shared_trajectory import TrajectoryChannel, TrajectoryWriter
+
+
+@pytest.fixture
+def channel_pair():
+    """Canal de la interfaz y escritor conectados, cerrados al terminar"""
+    channel = TrajectoryChannel(multiprocessing.get_context())
+    writer = TrajectoryWriter(*channel.writer_args())
+    yield channel, writer
+    writer.close()
+    channel.close()
+
+
+def trajectory(frames, columns=0, points=0, offset=0.0):
+    """Trayectoria de prueba con valores distintos en cada elemento"""
+    t = np.linspace(0.0, 1.0, frames) + offset
+    shape = (frames, columns) if columns else (frames,)
+    y = np.arange(np.prod(shape), dtype=float).reshape(shape) + offset
+    geometry = None
+    if points:
+        geometry = (np.arange(frames * points * 2, dtype=np.float32).reshape(frames, points, 2)
+                    + np.float32(offset))
+    return t, y, geometry
+
+
+def test_round_trip_single_mass(channel_pair):
+    channel, writer = channel_pair
+    assert channel.acquire() is None
+    t, y, _ = trajectory(50)
+    writer.write(7, t, y)
+
+    request_id, t_read, y_read, geometry = channel.acquire()
+    assert request_id == 7
+    np.testing.assert_array_equal(t_read, t)
+    np.testing.assert_array_equal(y_read, y)
+    assert geometry is None
+    # Ya tomada: no se devuelve dos veces
+    assert channel.acquire() is None
+
+
+def test_round_trip_chain_with_geometry(channel_pair):
+    channel, writer = channel_pair
+    t, y, geometry = trajectory(30, columns=4, points=12)
+    writer.write(1, t, y, geometry)
+
+    _, t_read, y_read, geometry_read = channel.acquire()
+    assert y_read.shape == (30, 4)
+    assert geometry_read.dtype == np.float32
+    np.testing.assert_array_equal(t_read, t)
+    np.testing.assert_array_equal(y_read, y)
+    np.testing.assert_array_equal(geometry_read, geometry)
+
+
+def test_buffers_grow_and_keep_data(channel_pair):
+    channel, writer = channel_pair
+    # Cada escritura no cabe en el búfer anterior (GROWTH = 1.5): ambos búferes
+    # se recrean con una nueva generación varias veces
+    for request_id, frames in enumerate((10, 40, 160, 640, 2560), start=1):
+        t, y, geometry = trajectory(frames, columns=3, points=5, offset=request_id)
+        writer.write(request_id, t, y, geometry)
+        acquired = channel.acquire()
+        assert acquired is not None and acquired[0] == request_id
+        np.testing.assert_array_equal(acquired[1], t)
+        np.testing.assert_array_equal(acquired[2], y)
+        np.testing.assert_array_equal(acquired[3], geometry)
+    generations = [segment[0] for segment in writer._segments]
+    assert max(generations) >= 1
+
+
+def test_held_buffer_is_never_overwritten(channel_pair):
+    channel, writer = channel_pair
+    t1, y1, _ = trajectory(20, offset=1.0)
+    writer.write(1, t1, y1)
+    _, t_held, y_held, _ = channel.acquire()
+
+    # Varias escrituras (una de ellas más grande) mientras la interfaz retiene la primera
+    for request_id, frames in ((2, 20), (3, 20), (4, 200)):
+        t, y, _ = trajectory(frames, offset=request_id)
+        writer.write(request_id, t, y)
+        np.testing.assert_array_equal(t_held, t1)
+        np.testing.assert_array_equal(y_held, y1)
+
+    request_id, t_read, y_read, _ = channel.acquire()
+    assert request_id == 4
+    np.testing.assert_array_equal(t_read, t)
+    np.testing.assert_array_equal(y_read, y)
+
+
+def test_acquire_only_newest_request(channel_pair):
+    channel, writer = channel_pair
+    t, y, _ = trajectory(15)
+    writer.write(1, t, y)
+    # Se espera la petición 2: la 1 es obsoleta y no se toma
+    assert channel.acquire(request_id=2) is None
+
+    writer.write(2, t, y * 2)
+    request_id, _, y_read, _ = channel.acquire(request_id=2)
+    assert request_id == 2
+    np.testing.assert_array_equal(y_read, y * 2)
+
+    # Una respuesta obsoleta publicada después no reemplaza la que se tiene
+    writer.write(1, t, y * 3)
+    assert channel.acquire(request_id=2) is None
+    np.testing.assert_array_equal(y_read, y * 2)